@@ -2,8 +2,12 @@
 
 Plain data only (no pygame types) so this stays a simple, readable
 description of a room's geometry -- `src/level.py` is what turns it into
-something the game can collide with and draw. This is a stand-in for a real
-tilemap pipeline, which is a later step once there's real content to build.
+something the game can collide with and draw. Most rooms list their
+platforms as rects; a room can instead draw its geometry as a "tilemap"
+(rows of tile characters, see src/tilemap.py), which
+tools/compile_rooms.py merges back into rects -- TILEMAP_TEST_ROOM below
+is the first. Rooms can also have one-way platforms and slopes alongside
+their solid rects (see SLOPE_TEST_ROOM).
 """
 
 # Platforms as (x, y, width, height) rectangles in world pixels, top-left
@@ -96,7 +100,7 @@ CLEARING = {
     # Heals/saves regardless of whether absorption's been unlocked yet --
     # reaching this spot is what matters, not how she got here.
     "checkpoint_zone": CLEARING_EXIT,
-    "next_room": DEEPER_FOREST,
+    "next_room": "DEEPER_FOREST",
     "music": "threat",
 }
 
@@ -122,7 +126,7 @@ FOREST_FLOOR = {
     "light_shaft": (1830, 60, 70, 420),
     "background": "forest_floor",
     "exit_zone": (1810, 380, 90, 160),
-    "next_room": CLEARING,
+    "next_room": "CLEARING",
     "music": "exploration",
 }
 
@@ -146,16 +150,109 @@ WAKING_HOLLOW = {
     "exit_zone": (1000, 380, 100, 160),
     "log_obstacle": HOLLOW_LOG,
     "tutorial_prompt": "Press Space to jump",
-    "next_room": FOREST_FLOOR,
+    "next_room": "FOREST_FLOOR",
     "music": "exploration",
 }
 
-# Rooms referenced by their "key" -- used by save/load and by respawn (both
-# need to name a room without serializing/duplicating its whole dict).
+# --- Tilemap sandbox ---------------------------------------------------------
+# Not part of the story, like TEST_ROOM: the first room authored as a tile
+# grid instead of rect tuples, to exercise src/tilemap.py end to end. 16px
+# tiles ("#" ground, "=" platform, "." empty), so world size comes from the
+# grid (1600x544) rather than world_width/world_height keys. Clearances use
+# the same numbers as the rect rooms: ground top at y=480, each platform an
+# 80px (5-tile) jump above the last with a 16px-thick underside that still
+# clears her 60px height, plus a two-step stair and a 64px pillar to hop.
+
+TILEMAP_TEST_ROOM = {
+    "key": "TILEMAP_TEST_ROOM",
+    "tilemap": {
+        "tile_size": 16,
+        "rows": [
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "...................................==========.......................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................................................................................................",
+            "....................==========......................................................................",
+            "...........................................................................###......................",
+            ".......................................................##########..........###......................",
+            "....................................................#############..........###......................",
+            "....................................................#############..........###......................",
+            "####################################################################################################",
+            "####################################################################################################",
+            "####################################################################################################",
+            "####################################################################################################",
+        ],
+    },
+    "player_spawn": (80, 480),
+}
+
+# --- Slope / one-way sandbox -------------------------------------------------
+# Not part of the story either: exercises the two non-rect kinds of
+# geometry (see src/physics.py). A 45-degree ramp (80x80) up onto a raised
+# block and a 22.5-degree one (160x80) back down, then two one-way
+# platforms to jump up through -- each 80px above the last, the same gap
+# as PLATFORM_A/B -- and a long 22.5-degree climb onto a ledge with an
+# enemy patrolling it, so walking the slopes gets checked for actors too.
+# A second enemy patrols the ground below the one-way platforms, so this
+# is also the room that lists its enemies as "enemies" rather than the
+# single "enemy_spawn" / "enemy_patrol_bounds" pair.
+
+SLOPE_TEST_ROOM = {
+    "key": "SLOPE_TEST_ROOM",
+    "world_width": 2000,
+    "world_height": 720,
+    "platforms": [
+        (0, 660, 2000, 60),
+        (380, 580, 200, 80),
+        (1460, 580, 400, 80),
+    ],
+    "ground_count": 3,
+    "one_way_platforms": [(900, 580, 150, 12), (1000, 500, 150, 12)],
+    # (x, y, w, h, rise) -- rise 1 climbs to the right, -1 to the left.
+    "slopes": [
+        (300, 580, 80, 80, 1),
+        (580, 580, 160, 80, -1),
+        (1300, 580, 160, 80, 1),
+    ],
+    "player_spawn": (100, 660),
+    # (x, y, patrol_left, patrol_right) -- feet position, then the x range
+    # it walks back and forth across.
+    "enemies": [
+        (1600, 580, 1300, 1860),
+        (1100, 660, 800, 1280),
+    ],
+}
+
+# Every room, by its "key" -- what tools/compile_rooms.py compiles into
+# assets/rooms/. The game itself names rooms only by key (save/load,
+# respawn, "next_room") and loads them through src/room_store.py.
 ROOM_REGISTRY = {
     "TEST_ROOM": TEST_ROOM,
     "WAKING_HOLLOW": WAKING_HOLLOW,
     "FOREST_FLOOR": FOREST_FLOOR,
     "CLEARING": CLEARING,
     "DEEPER_FOREST": DEEPER_FOREST,
+    "TILEMAP_TEST_ROOM": TILEMAP_TEST_ROOM,
+    "SLOPE_TEST_ROOM": SLOPE_TEST_ROOM,
 }
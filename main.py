@@ -2,8 +2,11 @@
 
 This just wires up the import path (game code in src/, room data in data/,
 kept separate on disk as described in README.md) and hands off to Game.
+`--record PATH` additionally saves the session's gameplay input to PATH
+for frame-exact replay (see src/replay.py, tools/replay_session.py).
 """
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -14,4 +17,7 @@ sys.path.insert(0, str(PROJECT_ROOT / "data"))
 from game import Game  # noqa: E402
 
 if __name__ == "__main__":
-    Game().run()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", metavar="PATH", type=Path, help="record gameplay input for replay")
+    args = parser.parse_args()
+    Game(record_path=args.record).run()
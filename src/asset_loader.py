@@ -0,0 +1,147 @@
+"""Decodes image files on a worker thread, ahead of when they're needed.
+
+Module-level state rather than a loader object threaded through every
+scene, same reasoning as audio.py. A scene that knows a file will be wanted
+soon calls `prefetch_image(path)` -- GameplayScene does for the next room's
+background once the player nears the exit -- and a single worker thread
+reads and decodes the PNG off the game loop. `poll()`, called once per
+frame from Game.run(), does the one step that stays on the main thread:
+convert()ing each finished decode to the display's pixel format.
+
+`load_image(path)` then hands the surface over: straight from memory if it
+was prefetched (or loaded before), waiting out a decode still in flight, or
+loading it synchronously if nobody asked ahead. Converted images stay
+resident -- a respawn rebuilds its room from the same background -- until
+`release(path)`; prefetch.py decides when that is.
+
+`prefetch_bytes(path)` / `load_bytes(path)` are the same for a file kept
+as raw bytes instead (music -- see audio.py), with nothing to convert.
+`prefetch_built(key, path, build)` / `load_built(key, path, build)` are
+the same for a surface made from an image rather than the image itself --
+a room's baked background (see level.bake_room) -- cached under a name
+instead of a path. Only the decode runs on the worker: `build` gets the
+decoded image on the main thread, in place of convert(), since drawing
+onto surfaces is the display's business too.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import pygame
+
+_executor: ThreadPoolExecutor | None = None
+# Keyed by path, or by name for built surfaces.
+_pending: dict[Path | str, Future[pygame.Surface]] = {}
+_images: dict[Path | str, pygame.Surface] = {}
+_builds: dict[str, Callable[[pygame.Surface], pygame.Surface]] = {}
+_pending_bytes: dict[Path, Future[bytes]] = {}
+_bytes: dict[Path, bytes] = {}
+
+
+def _decode(path: Path) -> pygame.Surface:
+    # No convert() here -- that's poll()'s job, on the main thread.
+    return pygame.image.load(str(path))
+
+
+def _finish(key: Path | str, decoded: pygame.Surface) -> pygame.Surface:
+    """A decoded image made ready to draw, on the main thread: built, if
+    it was asked for by prefetch_built(), else convert()ed."""
+    build = _builds.pop(key, None)
+    return build(decoded) if build is not None else decoded.convert()
+
+
+def _submit(function, *args) -> Future:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asset-loader")
+    return _executor.submit(function, *args)
+
+
+def prefetch_image(path: Path) -> None:
+    """Start decoding `path` in the background, if it isn't already
+    loaded or on its way."""
+    if path in _images or path in _pending:
+        return
+    _pending[path] = _submit(_decode, path)
+
+
+def prefetch_built(key: str, path: Path, build: Callable[[pygame.Surface], pygame.Surface]) -> None:
+    """Start decoding `path` in the background for `key`, if it isn't
+    already loaded or on its way; poll() then hands the decoded image to
+    `build`, whose result is what load_built() returns."""
+    if key in _images or key in _pending:
+        return
+    _pending[key] = _submit(_decode, path)
+    _builds[key] = build
+
+
+def prefetch_bytes(path: Path) -> None:
+    """Start reading `path` into memory in the background, if it isn't
+    already read or on its way."""
+    if path in _bytes or path in _pending_bytes:
+        return
+    _pending_bytes[path] = _submit(Path.read_bytes, path)
+
+
+def poll() -> None:
+    """Finish off any decodes the worker has completed. One that failed is
+    left pending, so its error surfaces from load_image() or load_built()
+    -- exactly where a synchronous load would have raised it."""
+    if not _pending:
+        return
+    for path, future in list(_pending.items()):
+        if future.done() and future.exception() is None:
+            del _pending[path]
+            _images[path] = _finish(path, future.result())
+
+
+def load_image(path: Path) -> pygame.Surface:
+    """`path`, decoded and convert()ed -- see the module docstring for
+    where it comes from. Shared, so callers must not draw onto it."""
+    image = _images.get(path)
+    if image is not None:
+        return image
+    future = _pending.pop(path, None)
+    decoded = future.result() if future is not None else _decode(path)
+    image = _images[path] = decoded.convert()
+    return image
+
+
+def load_built(key: str, path: Path, build: Callable[[pygame.Surface], pygame.Surface]) -> pygame.Surface:
+    """load_image() for a surface prefetch_built() makes: `key`'s, built
+    ahead, or now by `build` from `path`. Shared, like load_image()'s."""
+    image = _images.get(key)
+    if image is not None:
+        return image
+    future = _pending.pop(key, None)
+    _builds.pop(key, None)
+    decoded = future.result() if future is not None else _decode(path)
+    image = _images[key] = build(decoded)
+    return image
+
+
+def load_bytes(path: Path) -> bytes:
+    """`path`'s contents, read ahead by prefetch_bytes() or now."""
+    data = _bytes.get(path)
+    if data is not None:
+        return data
+    future = _pending_bytes.pop(path, None)
+    data = _bytes[path] = future.result() if future is not None else path.read_bytes()
+    return data
+
+
+def is_requested(path: Path) -> bool:
+    """Whether `path` is resident or on its way, as an image or as bytes."""
+    return path in _images or path in _pending or path in _bytes or path in _pending_bytes
+
+
+def release(path: Path | str) -> None:
+    """Drop `path` (or a built surface's key) from memory (a decode still
+    in flight is discarded when it finishes); the next load reads it from
+    disk again. Surfaces already handed out stay valid -- they're just no
+    longer shared."""
+    for cache in (_images, _pending, _builds, _bytes, _pending_bytes):
+        cache.pop(path, None)
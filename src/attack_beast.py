@@ -16,8 +16,8 @@ from enum import Enum, auto
 import pygame
 
 import settings
-from physics import move_and_collide
-from sprite_utils import SpriteSheet
+from physics import Solids, move_and_collide
+from sprite_utils import SpriteSheet, faded_frame, tinted_frame
 
 
 class BeastState(Enum):
@@ -29,7 +29,36 @@ class BeastState(Enum):
 
 
 class AttackBeast:
-    def __init__(self, sprite: SpriteSheet, spawn_x: float, spawn_y: float):
+    __slots__ = (
+        "sprite",
+        "width",
+        "height",
+        "x",
+        "y",
+        "prev_x",
+        "prev_y",
+        "_rect",
+        "_rect_x",
+        "_rect_y",
+        "vy",
+        "state",
+        "state_timer",
+        "strike_vx",
+        "_committed_direction",
+        "alive",
+        "absorb_timer",
+        "_rng",
+        "_jitter_offset",
+        "_jitter_timer",
+    )
+
+    def __init__(
+        self,
+        sprite: SpriteSheet,
+        spawn_x: float,
+        spawn_y: float,
+        rng: random.Random | None = None,
+    ):
         self.sprite = sprite
         # Same fixed collision size as Enemy (settings.ENEMY_COLLISION_*) --
         # they share the same base sprite, so they share the same box.
@@ -39,6 +68,13 @@ class AttackBeast:
         # spawn position is its feet; store the top-left corner for physics.
         self.x = float(spawn_x - self.width / 2)
         self.y = float(spawn_y - self.height)
+        # Position as of the previous simulation step, for draw() to blend
+        # from (see settings.FIXED_TIMESTEP).
+        self.prev_x = self.x
+        self.prev_y = self.y
+        # One Rect for the actor's whole life -- see `rect`.
+        self._rect = pygame.Rect(round(self.x), round(self.y), self.width, self.height)
+        self._rect_x, self._rect_y = self.x, self.y
         self.vy = 0.0
 
         self.state = BeastState.IDLE
@@ -49,13 +85,22 @@ class AttackBeast:
         self.absorb_timer = 0.0
 
         # Small, irregular per-frame draw offset -- "twitchy and
-        # arrhythmic" without needing new animation frames.
+        # arrhythmic" without needing new animation frames. Drawn from the
+        # scene's own seeded RNG, not the module-level one, so a recorded
+        # run replays identically (see src/replay.py).
+        self._rng = rng if rng is not None else random.Random()
         self._jitter_offset = (0, 0)
         self._jitter_timer = 0.0
 
     @property
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(round(self.x), round(self.y), self.width, self.height)
+        """Its collision box in whole pixels. One Rect is kept, moved in
+        place only when its position has changed since the last read, and
+        each read gets a copy of it -- the caller's to keep or modify."""
+        if self.x != self._rect_x or self.y != self._rect_y:
+            self._rect_x, self._rect_y = self.x, self.y
+            self._rect.x, self._rect.y = round(self.x), round(self.y)
+        return self._rect.copy()
 
     @property
     def is_striking(self) -> bool:
@@ -85,7 +130,16 @@ class AttackBeast:
         self.absorb_timer = settings.ABSORB_DURATION
         self.strike_vx = 0.0
 
-    def update(self, dt: float, solids: list[pygame.Rect], player_rect: pygame.Rect) -> None:
+    def render_position(self, alpha: float) -> tuple[float, float]:
+        """Its top-left, `alpha` (0..1) of the way from the previous step's
+        position to the current one."""
+        return (
+            self.prev_x + (self.x - self.prev_x) * alpha,
+            self.prev_y + (self.y - self.prev_y) * alpha,
+        )
+
+    def update(self, dt: float, solids: Solids, player_rect: pygame.Rect) -> None:
+        self.prev_x, self.prev_y = self.x, self.y
         if self.state is BeastState.ABSORBED:
             self.absorb_timer -= dt
             if self.absorb_timer <= 0:
@@ -131,10 +185,10 @@ class AttackBeast:
         self._jitter_timer -= dt
         if self._jitter_timer <= 0:
             jitter = settings.BEAST_IDLE_JITTER_PX
-            self._jitter_offset = (random.randint(-jitter, jitter), random.randint(-jitter, jitter))
-            self._jitter_timer = random.uniform(0.05, 0.3)
+            self._jitter_offset = (self._rng.randint(-jitter, jitter), self._rng.randint(-jitter, jitter))
+            self._jitter_timer = self._rng.uniform(0.05, 0.3)
 
-    def draw(self, surface: pygame.Surface, camera) -> None:
+    def draw(self, surface: pygame.Surface, camera, alpha: float = 1.0) -> None:
         if not self.alive:
             return
 
@@ -143,18 +197,14 @@ class AttackBeast:
             # The tell grows more intense as the wind-up nears its end --
             # a fair, escalating warning rather than a single flash.
             progress = 1 - (self.state_timer / settings.BEAST_TELEGRAPH_DURATION)
-            alpha = round(160 * progress)
-            frame = frame.copy()
-            flash = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
-            flash.fill((220, 60, 60, max(0, alpha)))
-            frame.blit(flash, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            frame = tinted_frame(frame, (220, 60, 60), 160 * progress)
         elif self.state is BeastState.ABSORBED:
-            frame = frame.copy()
             fade = max(0.0, self.absorb_timer / settings.ABSORB_DURATION)
-            frame.set_alpha(round(255 * fade))
+            frame = faded_frame(frame, 255 * fade)
 
         jitter_x, jitter_y = self._jitter_offset if self.state is not BeastState.ABSORBED else (0, 0)
-        draw_x = self.x - (frame.get_width() - self.width) / 2 + jitter_x
-        draw_y = self.y - (frame.get_height() - self.height) + jitter_y
+        x, y = self.render_position(alpha)
+        draw_x = x - (frame.get_width() - self.width) / 2 + jitter_x
+        draw_y = y - (frame.get_height() - self.height) + jitter_y
         screen_x, screen_y = camera.apply(draw_x, draw_y)
         surface.blit(frame, (round(screen_x), round(screen_y)))
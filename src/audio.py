@@ -11,6 +11,10 @@ instead a track change fades the outgoing track out, then starts the new
 one once that fade finishes, via `update()` -- call that once per frame
 from Game.run() regardless of which scene is active.
 
+A track warmed ahead of time (prefetch.py reads the next room's track
+into memory through asset_loader) starts from those bytes rather than
+opening the file on the frame the room changes.
+
 SFX files (assets/audio/sfx/*.wav) are procedurally synthesized by
 tools/generate_sound_effects.py -- not recorded/licensed audio, so unlike
 the three music tracks they're covered by this repo's own license.
@@ -18,8 +22,11 @@ the three music tracks they're covered by this repo's own license.
 
 from __future__ import annotations
 
+import io
+
 import pygame
 
+import asset_loader
 import settings
 
 AUDIO_DIR = settings.PROJECT_ROOT / "assets" / "audio"
@@ -89,6 +96,10 @@ def update() -> None:
         _start(track)
 
 
+def is_enabled() -> bool:
+    return _enabled
+
+
 def get_volume() -> float:
     return _volume
 
@@ -120,8 +131,12 @@ def play_sfx(name: str) -> None:
 
 def _start(track: str) -> None:
     global _current_track
+    path = TRACK_PATHS[track]
     try:
-        pygame.mixer.music.load(str(TRACK_PATHS[track]))
+        if asset_loader.is_requested(path):
+            pygame.mixer.music.load(io.BytesIO(asset_loader.load_bytes(path)), path.suffix[1:])
+        else:
+            pygame.mixer.music.load(str(path))
         pygame.mixer.music.set_volume(_volume)
         pygame.mixer.music.play(loops=-1, fade_ms=FADE_IN_MS)
         _current_track = track
@@ -14,9 +14,16 @@ class Camera:
         # (x, y) of the camera's top-left corner, in world space.
         self.x = 0.0
         self.y = 0.0
+        # Where the previous simulation step left it, and the blend of the
+        # two that apply() actually draws from (see interpolate()).
+        self.prev_x = 0.0
+        self.prev_y = 0.0
+        self._render_x = 0.0
+        self._render_y = 0.0
 
     def update(self, target_x: float, target_y: float, dt: float) -> None:
         """Ease the camera toward centering on (target_x, target_y)."""
+        self.prev_x, self.prev_y = self.x, self.y
         desired_x = target_x - WINDOW_WIDTH / 2
         desired_y = target_y - WINDOW_HEIGHT / 2
 
@@ -27,6 +34,13 @@ class Camera:
         self.y += (desired_y - self.y) * t
 
         self._clamp_to_world()
+        self._render_x, self._render_y = self.x, self.y
+
+    def interpolate(self, alpha: float) -> None:
+        """Draw from a point `alpha` (0..1) of the way from the previous
+        step's position to the current one -- see settings.FIXED_TIMESTEP."""
+        self._render_x = self.prev_x + (self.x - self.prev_x) * alpha
+        self._render_y = self.prev_y + (self.y - self.prev_y) * alpha
 
     def _clamp_to_world(self) -> None:
         max_x = max(0, self.world_width - WINDOW_WIDTH)
@@ -36,7 +50,11 @@ class Camera:
 
     def apply(self, world_x: float, world_y: float) -> tuple[float, float]:
         """Convert a world-space point to screen-space."""
-        return world_x - self.x, world_y - self.y
+        return world_x - self._render_x, world_y - self._render_y
+
+    def screen_origin(self) -> tuple[int, int]:
+        """Where world (0, 0) lands on screen, in whole pixels."""
+        return round(-self._render_x), round(-self._render_y)
 
     def apply_rect(self, rect: pygame.Rect) -> pygame.Rect:
         screen_x, screen_y = self.apply(rect.x, rect.y)
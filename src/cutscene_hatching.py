@@ -14,12 +14,13 @@ import random
 
 import pygame
 
+import room_store
 import settings
 from game_progress import GameProgress
 from gameplay_scene import GameplayScene
-from rooms import WAKING_HOLLOW
 from scene import Scene
 from sprite_utils import load_sprite
+from text_render import get_font, render_text
 
 BACKGROUND_PATH = settings.PROJECT_ROOT / "assets" / "backgrounds" / "cutscene_hatching_hollow.png"
 COLOR_SKIP_HINT = (110, 112, 105)
@@ -60,9 +61,12 @@ class CutsceneHatchingScene(Scene):
         anchor_x, anchor_y = egg_sprite.anchor
         self._anchor = (anchor_x * CLOSEUP_ZOOM, anchor_y * CLOSEUP_ZOOM)
 
-        self.hint_font = pygame.font.Font(None, 20)
+        self.hint_font = get_font(20)
         self.elapsed = 0.0
         self._skip_requested = False
+        # (frame, jitter) the last draw() showed -- the still beats (sitting,
+        # broken, black) don't change between frames; trembling does.
+        self._drawn_state: tuple[str | None, int] | None = None
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_x):
@@ -70,7 +74,7 @@ class CutsceneHatchingScene(Scene):
 
     def update(self, dt: float) -> Scene | None:
         if self._skip_requested or self.elapsed >= TOTAL_DURATION:
-            return GameplayScene(WAKING_HOLLOW, self.progress)
+            return GameplayScene(room_store.load_room("WAKING_HOLLOW"), self.progress)
         self.elapsed += dt
         return None
 
@@ -89,8 +93,15 @@ class CutsceneHatchingScene(Scene):
             return "broken", 0
         return None, 0  # hard cut to black
 
+    def dirty_rects(self) -> list[pygame.Rect] | None:
+        state = self._current_frame_and_jitter()
+        if state == self._drawn_state and state[1] == 0:
+            return []
+        return None
+
     def draw(self, surface: pygame.Surface) -> None:
         frame_name, jitter = self._current_frame_and_jitter()
+        self._drawn_state = (frame_name, jitter)
 
         if frame_name is None:
             surface.fill((0, 0, 0))
@@ -107,6 +118,6 @@ class CutsceneHatchingScene(Scene):
         )
         surface.blit(frame, top_left)
 
-        hint = self.hint_font.render(SKIP_HINT_TEXT, True, COLOR_SKIP_HINT)
+        hint = render_text(self.hint_font, SKIP_HINT_TEXT, COLOR_SKIP_HINT)
         hint_rect = hint.get_rect(centerx=settings.WINDOW_WIDTH // 2, bottom=settings.WINDOW_HEIGHT - 16)
         surface.blit(hint, hint_rect)
@@ -14,11 +14,13 @@ from __future__ import annotations
 
 import pygame
 
+import asset_loader
 import audio
 import settings
 from game_progress import GameProgress
 from scene import Scene
 from sprite_utils import load_sprite
+from text_render import get_font, render_text
 
 BACKGROUND_PATH = settings.PROJECT_ROOT / "assets" / "backgrounds" / "master_reveal.png"
 
@@ -55,16 +57,23 @@ class CutsceneMasterScene(Scene):
         }
         anchor_x, anchor_y = master_sprite.anchor
         self._anchor = (anchor_x * CLOSEUP_ZOOM, anchor_y * CLOSEUP_ZOOM)
+        # The only part of the reveal that changes between its frames is
+        # the Master's ember flicker -- the block both ember frames cover.
+        top_left = (MASTER_ANCHOR_SCREEN[0] - self._anchor[0], MASTER_ANCHOR_SCREEN[1] - self._anchor[1])
+        self._ember_rect = self._frames["ember_small"].get_rect(topleft=top_left).union(
+            self._frames["ember_big"].get_rect(topleft=top_left)
+        )
 
-        self.background = pygame.image.load(str(BACKGROUND_PATH)).convert()
+        self.background = asset_loader.load_image(BACKGROUND_PATH)
 
         audio.play_track("warmth")
 
-        self._title_font = pygame.font.Font(None, 34)
+        self._title_font = get_font(34)
         self._elapsed = 0.0
         self._ember_timer = 0.0
         self._ember_frame_is_small = True
         self._skip_requested = False
+        self._drawn_state: tuple[str, bool] | None = None
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type != pygame.KEYDOWN:
@@ -96,7 +105,23 @@ class CutsceneMasterScene(Scene):
 
         return None
 
+    def _phase(self) -> str:
+        if self._elapsed < REVEAL_DURATION:
+            return "reveal"
+        if self._elapsed < REVEAL_DURATION + BLACK_DURATION:
+            return "black"
+        return "end_card"
+
+    def dirty_rects(self) -> list[pygame.Rect] | None:
+        state = (self._phase(), self._ember_frame_is_small)
+        if self._drawn_state is None or state[0] != self._drawn_state[0]:
+            return None
+        if state == self._drawn_state or state[0] != "reveal":
+            return []
+        return [self._ember_rect]
+
     def draw(self, surface: pygame.Surface) -> None:
+        self._drawn_state = (self._phase(), self._ember_frame_is_small)
         if self._elapsed < REVEAL_DURATION:
             self._draw_reveal(surface)
         elif self._elapsed < REVEAL_DURATION + BLACK_DURATION:
@@ -118,6 +143,6 @@ class CutsceneMasterScene(Scene):
 
     def _draw_end_card(self, surface: pygame.Surface) -> None:
         surface.fill(COLOR_END_CARD_BACKGROUND)
-        text = self._title_font.render("-- End of Chapter 0 --", True, COLOR_TEXT)
+        text = render_text(self._title_font, "-- End of Chapter 0 --", COLOR_TEXT)
         rect = text.get_rect(center=(settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2))
         surface.blit(text, rect)
@@ -9,6 +9,7 @@ later without touching the timing/advance logic below.
 
 from __future__ import annotations
 
+import numpy as np
 import pygame
 
 import settings
@@ -16,11 +17,15 @@ from cutscene_hatching import CutsceneHatchingScene
 from game_progress import GameProgress
 from narration import WORLD_NARRATION
 from scene import Scene
+from text_render import get_font, render_text
 
 BACKGROUND_PATH = settings.PROJECT_ROOT / "assets" / "backgrounds" / "cutscene_world.png"
 COLOR_LETTERBOX = (0, 0, 0)
 COLOR_TEXT = (215, 210, 200)
 COLOR_SKIP_HINT = (130, 130, 130)
+# The black scrim's opacity once a card has faded in; the text comes up
+# over it at the same rate.
+SCRIM_ALPHA = 120
 
 SKIP_HINT_TEXT = "Press Esc or X to skip cutscene"
 
@@ -57,12 +62,19 @@ class CutsceneWorldScene(Scene):
     def __init__(self, progress: GameProgress):
         self.progress = progress
         self.background = pygame.image.load(str(BACKGROUND_PATH)).convert()
-        self.font = pygame.font.Font(None, 30)
-        self.hint_font = pygame.font.Font(None, 20)
+        self.font = get_font(30)
+        self.hint_font = get_font(20)
         self.card_index = 0
         self.card_elapsed = 0.0
         self._advance_requested = False
         self._skip_requested = False
+        # What the last draw() showed (card, fade alpha), and the block the
+        # card's text + scrim covered -- once a card has faded in, nothing
+        # changes until the next one (see dirty_rects()).
+        self._drawn_state: tuple[int, int] | None = None
+        self._text_rect: pygame.Rect | None = None
+        # Each card's text and scrim, composited once (see _card()).
+        self._cards: dict[int, tuple[pygame.Surface, int]] = {}
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -83,31 +95,65 @@ class CutsceneWorldScene(Scene):
             self.card_elapsed = 0.0
             if self.card_index >= len(WORLD_NARRATION):
                 return CutsceneHatchingScene(self.progress)
+        elif self.card_elapsed >= FADE_IN_DURATION and self.card_index + 1 < len(WORLD_NARRATION):
+            # Nothing is redrawn while a card just sits there, so that's
+            # when the next one gets built.
+            self._card(self.card_index + 1)
 
         return None
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.blit(self.background, (0, 0))
+    def _card(self, index: int) -> tuple[pygame.Surface, int]:
+        """Card `index`'s lines, wrapped and rendered over their scrim into
+        one surface (at full opacity -- draw() fades the whole thing), and
+        the y it's drawn at. Built once per card."""
+        if index in self._cards:
+            return self._cards[index]
 
         max_width = settings.WINDOW_WIDTH - 2 * TEXT_MARGIN
-        lines = _wrap_text(self.font, WORLD_NARRATION[self.card_index], max_width)
+        lines = _wrap_text(self.font, WORLD_NARRATION[index], max_width)
         line_surfaces = [self.font.render(line, True, COLOR_TEXT) for line in lines]
-
-        alpha = round(255 * min(1.0, self.card_elapsed / FADE_IN_DURATION))
         total_height = sum(s.get_height() for s in line_surfaces) + LINE_SPACING * (len(line_surfaces) - 1)
-        y = (settings.WINDOW_HEIGHT - total_height) // 2
 
         # A soft scrim behind the text -- the background is a real scene
         # now, not a flat fill, so legibility needs a little help.
-        scrim = pygame.Surface((settings.WINDOW_WIDTH, total_height + 40), pygame.SRCALPHA)
-        scrim.fill((0, 0, 0, round(120 * min(1.0, self.card_elapsed / FADE_IN_DURATION))))
-        surface.blit(scrim, (0, y - 20))
-
+        card = pygame.Surface((settings.WINDOW_WIDTH, total_height + 40), pygame.SRCALPHA)
+        y = 20
         for line_surface in line_surfaces:
-            line_surface.set_alpha(alpha)
             rect = line_surface.get_rect(centerx=settings.WINDOW_WIDTH // 2, top=y)
-            surface.blit(line_surface, rect)
+            card.blit(line_surface, rect)
             y += line_surface.get_height() + LINE_SPACING
+        # Then the scrim goes under the text -- an "over" composite done by
+        # hand, since blitting text onto a translucent surface would darken
+        # its antialiased edges.
+        alpha = pygame.surfarray.pixels_alpha(card)
+        rgb = pygame.surfarray.pixels3d(card)
+        coverage = alpha / 255
+        combined = coverage + SCRIM_ALPHA / 255 * (1 - coverage)
+        rgb[...] = np.round(rgb * (coverage / combined)[..., None])
+        alpha[...] = np.round(combined * 255)
+        del alpha, rgb
+
+        self._cards[index] = (card, (settings.WINDOW_HEIGHT - total_height) // 2 - 20)
+        return self._cards[index]
+
+    def _fade_alpha(self) -> int:
+        return round(255 * min(1.0, self.card_elapsed / FADE_IN_DURATION))
+
+    def dirty_rects(self) -> list[pygame.Rect] | None:
+        if self._drawn_state is None or self._drawn_state[0] != self.card_index:
+            return None
+        if self._drawn_state[1] == self._fade_alpha():
+            return []
+        return [self._text_rect]
+
+    def draw(self, surface: pygame.Surface) -> None:
+        alpha = self._fade_alpha()
+        self._drawn_state = (self.card_index, alpha)
+        surface.blit(self.background, (0, 0))
+
+        card, top = self._card(self.card_index)
+        card.set_alpha(alpha)
+        self._text_rect = surface.blit(card, (0, top))
 
         pygame.draw.rect(surface, COLOR_LETTERBOX, (0, 0, settings.WINDOW_WIDTH, LETTERBOX_HEIGHT))
         pygame.draw.rect(
@@ -116,7 +162,7 @@ class CutsceneWorldScene(Scene):
             (0, settings.WINDOW_HEIGHT - LETTERBOX_HEIGHT, settings.WINDOW_WIDTH, LETTERBOX_HEIGHT),
         )
 
-        hint = self.hint_font.render(SKIP_HINT_TEXT, True, COLOR_SKIP_HINT)
+        hint = render_text(self.hint_font, SKIP_HINT_TEXT, COLOR_SKIP_HINT)
         hint_rect = hint.get_rect(
             centerx=settings.WINDOW_WIDTH // 2, centery=settings.WINDOW_HEIGHT - LETTERBOX_HEIGHT // 2
         )
@@ -1,88 +1,228 @@
 """The placeholder corrupted beast: a simple back-and-forth patrol whose
-only real job is to exist as something the Hatchling can absorb."""
+only real job is to exist as something the Hatchling can absorb.
+
+Every patroller in a room lives in one EnemyStore (see entity_store.py):
+patrol turnarounds, gravity and the absorb fade run for all of them at
+once, and only the collision move itself is per patroller.
+"""
 
 from __future__ import annotations
 
+import numpy as np
 import pygame
 
 import settings
-from physics import move_and_collide
-from sprite_utils import SpriteSheet
+from entity_store import ROW_LOOP_MAX_ROWS, EntityStore
+from physics import Solids, move_and_collide
+from sprite_utils import SpriteSheet, faded_frame
+
+ENEMY_DTYPE = np.dtype(
+    [
+        ("x", np.float64),
+        ("y", np.float64),
+        # Position as of the previous simulation step, for draw() to blend
+        # from (see settings.FIXED_TIMESTEP).
+        ("prev_x", np.float64),
+        ("prev_y", np.float64),
+        ("vx", np.float64),
+        ("vy", np.float64),
+        ("patrol_min", np.float64),
+        ("patrol_max", np.float64),
+        ("alive", np.bool_),
+        ("being_absorbed", np.bool_),
+        ("absorb_timer", np.float64),
+    ]
+)
 
 
 class Enemy:
-    def __init__(
-        self,
-        sprite: SpriteSheet,
-        spawn_x: float,
-        spawn_y: float,
-        patrol_bounds: tuple[int, int],
-    ):
-        self.sprite = sprite
-        # Collision size is fixed (settings.ENEMY_COLLISION_*), independent
-        # of the sprite's actual pixel size -- see settings.py.
-        self.width = settings.ENEMY_COLLISION_WIDTH
-        self.height = settings.ENEMY_COLLISION_HEIGHT
+    """One patroller: a view onto its EnemyStore row."""
 
-        # spawn position is its feet; store the top-left corner for physics.
-        self.x = float(spawn_x - self.width / 2)
-        self.y = float(spawn_y - self.height)
-        self.vx = settings.ENEMY_PATROL_SPEED
-        self.vy = 0.0
+    __slots__ = ("_store", "_index")
 
-        self.patrol_min, self.patrol_max = patrol_bounds
+    def __init__(self, store: EnemyStore, index: int):
+        self._store = store
+        self._index = index
 
-        self.alive = True
-        self.being_absorbed = False
-        self.absorb_timer = 0.0
+    @property
+    def x(self) -> float:
+        return float(self._store.data["x"][self._index])
+
+    @property
+    def y(self) -> float:
+        return float(self._store.data["y"][self._index])
+
+    @property
+    def alive(self) -> bool:
+        return bool(self._store.data["alive"][self._index])
+
+    @property
+    def being_absorbed(self) -> bool:
+        return bool(self._store.data["being_absorbed"][self._index])
 
     @property
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(round(self.x), round(self.y), self.width, self.height)
+        """Its collision box: a copy of the store's, which moves in place
+        as it does -- the caller's to keep or modify."""
+        return self._store.rects[self._index].copy()
 
     def begin_absorbed(self) -> None:
         """Start the same-length fade-out beat that mirrors the player's lock."""
-        self.being_absorbed = True
-        self.absorb_timer = settings.ABSORB_DURATION
-        self.vx = 0.0
+        row = self._store.data[self._index]
+        row["being_absorbed"] = True
+        row["absorb_timer"] = settings.ABSORB_DURATION
+        row["vx"] = 0.0
+
+    def render_position(self, alpha: float) -> tuple[float, float]:
+        """Its top-left, `alpha` (0..1) of the way from the previous step's
+        position to the current one."""
+        row = self._store.data[self._index]
+        return (
+            float(row["prev_x"] + (row["x"] - row["prev_x"]) * alpha),
+            float(row["prev_y"] + (row["y"] - row["prev_y"]) * alpha),
+        )
 
-    def update(self, dt: float, solids: list[pygame.Rect]) -> None:
-        if not self.alive:
-            return
 
-        if self.being_absorbed:
-            self.absorb_timer -= dt
-            if self.absorb_timer <= 0:
-                self.alive = False
-                self.being_absorbed = False
-            return
+class EnemyStore(EntityStore):
+    DTYPE = ENEMY_DTYPE
+    VIEW = Enemy
+    # Collision size is fixed (settings.ENEMY_COLLISION_*), independent of
+    # the sprite's actual pixel size -- see settings.py.
+    WIDTH = settings.ENEMY_COLLISION_WIDTH
+    HEIGHT = settings.ENEMY_COLLISION_HEIGHT
 
-        if self.x <= self.patrol_min:
-            self.vx = abs(self.vx)
-        elif self.x + self.width >= self.patrol_max:
-            self.vx = -abs(self.vx)
+    def __init__(
+        self,
+        sprite: SpriteSheet,
+        spawns: list[tuple[float, float]],
+        patrol_bounds: list[tuple[int, int]],
+    ):
+        super().__init__(sprite, len(spawns))
+        data = self.data
+        # spawn position is its feet; store the top-left corner for physics.
+        self._place_feet(spawns)
+        data["prev_x"] = data["x"]
+        data["prev_y"] = data["y"]
+        data["vx"] = settings.ENEMY_PATROL_SPEED
+        bounds = np.asarray(patrol_bounds, dtype=np.float64).reshape(-1, 2)
+        data["patrol_min"] = bounds[:, 0]
+        data["patrol_max"] = bounds[:, 1]
+
+    def update(self, dt: float, solids: Solids) -> None:
+        if len(self.data) <= ROW_LOOP_MAX_ROWS:
+            self._update_rows(dt, solids)
+            return
 
-        self.vy = min(self.vy + settings.GRAVITY_FALL * dt, settings.MAX_FALL_SPEED)
+        data = self.data
+        data["prev_x"] = data["x"]
+        data["prev_y"] = data["y"]
 
-        dx = self.vx * dt
-        dy = self.vy * dt
-        self.x, self.y, collision = move_and_collide(
-            self.x, self.y, self.width, self.height, dx, dy, solids
-        )
-        if collision.touched_bottom:
-            self.vy = 0.0
+        # Absorb fade: tick down, and drop out once it's done.
+        absorbing = data["alive"] & data["being_absorbed"]
+        timers = data["absorb_timer"]
+        timers[absorbing] -= dt
+        finished = absorbing & (timers <= 0)
+        data["alive"][finished] = False
+        data["being_absorbed"][finished] = False
 
-    def draw(self, surface: pygame.Surface, camera) -> None:
-        if not self.alive:
+        moving = data["alive"] & ~absorbing
+        if not moving.any():
             return
 
+        # Patrol: turn around at either end of the patrol span.
+        x, vx = data["x"], data["vx"]
+        turn_right = moving & (x <= data["patrol_min"])
+        turn_left = moving & ~turn_right & (x + self.width >= data["patrol_max"])
+        vx[turn_right] = np.abs(vx[turn_right])
+        vx[turn_left] = -np.abs(vx[turn_left])
+
+        # Gravity.
+        vy = data["vy"]
+        vy[moving] = np.minimum(vy[moving] + settings.GRAVITY_FALL * dt, settings.MAX_FALL_SPEED)
+
+        # Collision stays per patroller (each meets different solids), but
+        # in plain floats: columns out as lists, results back in one go.
+        indices = np.flatnonzero(moving)
+        moves = zip(
+            data["x"][indices].tolist(),
+            data["y"][indices].tolist(),
+            (data["vx"][indices] * dt).tolist(),
+            (data["vy"][indices] * dt).tolist(),
+        )
+        new_xs, new_ys, landed = [], [], []
+        for index, (x, y, dx, dy) in zip(indices.tolist(), moves):
+            x, y, collision = move_and_collide(x, y, self.width, self.height, dx, dy, solids)
+            new_xs.append(x)
+            new_ys.append(y)
+            landed.append(collision.touched_bottom)
+            rect = self.rects[index]
+            rect.x, rect.y = round(x), round(y)
+        data["x"][indices] = new_xs
+        data["y"][indices] = new_ys
+        vy[indices[np.asarray(landed, dtype=bool)]] = 0.0
+
+    def _update_rows(self, dt: float, solids: Solids) -> None:
+        """update(), one row at a time: the rows out as tuples of plain
+        floats, and back in with one assignment."""
+        rows = self.data.tolist()
+        for index, row in enumerate(rows):
+            # Field order is ENEMY_DTYPE's.
+            x, y, _, _, vx, vy, patrol_min, patrol_max, alive, absorbing, timer = row
+            prev_x, prev_y = x, y
+            if absorbing and alive:
+                timer -= dt
+                if timer <= 0:
+                    alive = absorbing = False
+            elif alive:
+                if x <= patrol_min:
+                    vx = abs(vx)
+                elif x + self.width >= patrol_max:
+                    vx = -abs(vx)
+                vy = min(vy + settings.GRAVITY_FALL * dt, settings.MAX_FALL_SPEED)
+                x, y, collision = move_and_collide(x, y, self.width, self.height, vx * dt, vy * dt, solids)
+                if collision.touched_bottom:
+                    vy = 0.0
+                rect = self.rects[index]
+                rect.x, rect.y = round(x), round(y)
+            rows[index] = (x, y, prev_x, prev_y, vx, vy, patrol_min, patrol_max, alive, absorbing, timer)
+        self.data[:] = rows
+
+    def first_touching(self, rect: pygame.Rect) -> Enemy | None:
+        """The first live patroller (not already being absorbed) whose
+        collision box overlaps `rect`, or None -- one test for all rows."""
+        data = self.data
+        if len(data) <= ROW_LOOP_MAX_ROWS:
+            for index in rect.collidelistall(self.rects):
+                if data["alive"][index] and not data["being_absorbed"][index]:
+                    return self[index]
+            return None
+
+        left = np.round(data["x"])
+        top = np.round(data["y"])
+        touching = (
+            data["alive"]
+            & ~data["being_absorbed"]
+            & (left < rect.right)
+            & (left + self.width > rect.left)
+            & (top < rect.bottom)
+            & (top + self.height > rect.top)
+        )
+        hits = np.flatnonzero(touching)
+        return self[int(hits[0])] if len(hits) else None
+
+    def draw(self, surface: pygame.Surface, camera, alpha: float = 1.0) -> None:
+        data = self.data
         frame = self.sprite.get("idle")
-        if self.being_absorbed:
-            frame = frame.copy()
-            fade = max(0.0, self.absorb_timer / settings.ABSORB_DURATION)
-            frame.set_alpha(round(255 * fade))
-
-        draw_x = self.x - (frame.get_width() - self.width) / 2
-        draw_y = self.y - (frame.get_height() - self.height)
-        screen_x, screen_y = camera.apply(draw_x, draw_y)
-        surface.blit(frame, (round(screen_x), round(screen_y)))
+        # Same offset for every row: the frame's feet on the box's bottom
+        # centre.
+        offset_x = (frame.get_width() - self.width) / 2
+        offset_y = frame.get_height() - self.height
+        xs = data["prev_x"] + (data["x"] - data["prev_x"]) * alpha - offset_x
+        ys = data["prev_y"] + (data["y"] - data["prev_y"]) * alpha - offset_y
+        for index in np.flatnonzero(data["alive"]).tolist():
+            row_frame = frame
+            if data["being_absorbed"][index]:
+                fade = max(0.0, float(data["absorb_timer"][index]) / settings.ABSORB_DURATION)
+                row_frame = faded_frame(frame, 255 * fade)
+            screen_x, screen_y = camera.apply(float(xs[index]), float(ys[index]))
+            surface.blit(row_frame, (round(screen_x), round(screen_y)))
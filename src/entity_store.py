@@ -0,0 +1,78 @@
+"""Column storage for a room's many small actors.
+
+A room can hold hundreds of patrolling enemies or undergrowth hazards, and
+one Python object per actor -- each with its own update() doing the same
+few float operations -- spends most of its frame on dispatch. Instead each
+kind of actor lives in an EntityStore: one NumPy structured array, a row
+per actor and a column per field (position, velocity, timers, state
+flags), updated by batched "systems" that touch every row at once
+(EnemyStore in src/enemy.py, PlantStore in src/hazard.py).
+
+Code that deals with one actor at a time -- the scene's absorb check, say
+-- gets a thin view from the store (`store[i]`, or iterating the store):
+an Enemy / CorruptedPlant reads and writes its row, so there's still one
+source of truth. Each row also has one pygame.Rect in `rects`, its
+collision box, which the store moves in place as the actor moves: the
+batched checks test against those directly, and a view's `rect` is a
+copy, so nothing outside the store can move one.
+
+Each NumPy call has a fixed cost of a microsecond or two, whatever the row
+count, and a batched update makes a couple of dozen of them -- more than
+walking a few rows in plain Python costs. So a store with at most
+ROW_LOOP_MAX_ROWS rows (every hand-authored room) updates its rows one by
+one instead, with the same arithmetic; the batched systems take over past
+that.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+import pygame
+
+from sprite_utils import SpriteSheet
+
+# Up to this many rows, update() loops over them in plain Python rather
+# than running its batched NumPy version -- see the module docstring.
+ROW_LOOP_MAX_ROWS = 24
+
+
+class EntityStore:
+    """Rows of `DTYPE`, one per actor, sharing one sprite and one fixed
+    collision size. Rooms never spawn actors mid-room, so the row count is
+    fixed when the store is built; a dead actor keeps its row with `alive`
+    cleared."""
+
+    DTYPE: np.dtype
+    VIEW: type
+    WIDTH: int
+    HEIGHT: int
+
+    def __init__(self, sprite: SpriteSheet, count: int):
+        self.sprite = sprite
+        self.width = self.WIDTH
+        self.height = self.HEIGHT
+        self.data = np.zeros(count, dtype=self.DTYPE)
+        self.data["alive"] = True
+        self.rects: list[pygame.Rect] = []
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: int):
+        return self.VIEW(self, index)
+
+    def __iter__(self) -> Iterator:
+        return (self.VIEW(self, index) for index in range(len(self.data)))
+
+    def _place_feet(self, spawns) -> None:
+        """Top-left corners from (x, y) spawn points at each actor's
+        horizontal centre, on the ground it stands on."""
+        points = np.asarray(spawns, dtype=np.float64).reshape(-1, 2)
+        self.data["x"] = points[:, 0] - self.width / 2
+        self.data["y"] = points[:, 1] - self.height
+        self.rects = [
+            pygame.Rect(round(x), round(y), self.width, self.height)
+            for x, y in zip(self.data["x"].tolist(), self.data["y"].tolist())
+        ]
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import math
+import time
+from pathlib import Path
+
 import pygame
 
+import asset_loader
 import audio
+import profiling
 import settings
+from gameplay_scene import GAMEPLAY_SPRITES, GameplayScene
+from profiler_overlay import ProfilerOverlay
+from replay import InputRecorder
+from sprite_utils import preload_sprites, release_sprites
 from title_scene import TitleScene
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, record_path: Path | None = None):
         pygame.init()
         pygame.display.set_caption(settings.WINDOW_TITLE)
         self.fullscreen = False
@@ -24,55 +34,231 @@ class Game:
         # used for headless testing), which would crash fullscreen toggling
         # for real players on similarly limited setups.
         self.game_surface = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+        # Resident for the whole session -- see GAMEPLAY_SPRITES.
+        preload_sprites(GAMEPLAY_SPRITES)
+        # Fullscreen layout, worked out once per display mode rather than
+        # every frame -- see _layout_fullscreen().
+        self._layout_size: tuple[int, int] | None = None
+        self._scale = 1.0
+        self._integer_scale: int | None = None
+        self._view_rect = pygame.Rect(0, 0, 0, 0)
+        self._scale_target: pygame.Surface | None = None
+        self._letterbox: list[pygame.Rect] = []
         self.clock = pygame.time.Clock()
+        self._accumulator = 0.0
         self.running = False
         self.scene = TitleScene()
+        # Records the first gameplay run of this session (every room from
+        # the first one entered, until quit) -- see src/replay.py.
+        self._recorder = InputRecorder(record_path) if record_path is not None else None
+        # Which scene game_surface currently holds a frame of -- a scene
+        # change (or anything else that invalidates what's on screen)
+        # always gets a full redraw, whatever dirty_rects() says.
+        self._drawn_scene = None
+        # Up while F3 has it toggled on -- see src/profiler_overlay.py.
+        self._profiler_overlay: ProfilerOverlay | None = None
 
     def run(self) -> None:
         self.running = True
         while self.running:
-            dt = self.clock.tick(settings.FPS) / 1000.0
-            dt = min(dt, 1 / 30)  # avoid huge steps if the window was paused/dragged
+            frame_time = self.clock.tick(settings.FPS) / 1000.0
+            frame_start = time.perf_counter()
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
-                    self._toggle_fullscreen()
-                else:
-                    self.scene.handle_event(event)
+            with profiling.zone("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+                        self._toggle_fullscreen()
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        self._toggle_profiler()
+                    elif event.type == pygame.WINDOWEXPOSED:
+                        self._drawn_scene = None  # the OS may have thrown away what was on screen
+                    else:
+                        self.scene.handle_event(event)
 
             if self.scene.quit_requested:
                 self.running = False
 
-            next_scene = self.scene.update(dt)
-            if next_scene is not None:
-                self.scene = next_scene
-            audio.update()
+            with profiling.zone("update"):
+                self._simulate(frame_time)
+            with profiling.zone("audio"):
+                audio.update()
+            with profiling.zone("assets"):
+                asset_loader.poll()
 
-            self.scene.draw(self.game_surface)
-            self._present()
+            dirty = None
+            # The overlay changes every frame, so while it's up every frame
+            # is drawn and presented whole.
+            overlay_shown = self._profiler_overlay is not None
+            if settings.DIRTY_RECT_PRESENT and self._drawn_scene is self.scene and not overlay_shown:
+                dirty = self.scene.dirty_rects()
+            if dirty != []:  # an empty list: nothing changed, so skip drawing and presenting
+                with profiling.zone("draw"):
+                    self.scene.draw(self.game_surface)
+                if self._profiler_overlay is not None:
+                    self._profiler_overlay.draw(self.game_surface)
+                self._drawn_scene = self.scene
+                with profiling.zone("present"):
+                    self._present(dirty)
+            profiling.end_frame(time.perf_counter() - frame_start)
 
+        if self._recorder is not None:
+            self._recorder.close()
+        release_sprites(GAMEPLAY_SPRITES)
         pygame.quit()
 
-    def _present(self) -> None:
+    def _simulate(self, frame_time: float) -> None:
+        if not settings.FIXED_TIMESTEP:
+            dt = min(frame_time, 1 / 30)  # avoid huge steps if the window was paused/dragged
+            self._step(dt)
+            self.scene.render_alpha = 1.0
+            return
+
+        # Fixed steps: the frame's real time is banked, then spent in
+        # constant-size updates; whatever's left over (less than one step)
+        # is how far draw() should blend toward the next one.
+        step = 1 / settings.SIMULATION_HZ
+        self._accumulator += min(frame_time, settings.MAX_FRAME_TIME)
+        while self._accumulator >= step:
+            self._accumulator -= step
+            self._step(step)
+        self.scene.render_alpha = self._accumulator / step
+
+    def _step(self, dt: float) -> None:
+        next_scene = self.scene.update(dt)
+        if next_scene is not None:
+            self.scene = next_scene
+            if (
+                self._recorder is not None
+                and not self._recorder.started
+                and isinstance(next_scene, GameplayScene)
+            ):
+                self._recorder.start(next_scene)
+
+    def _present(self, dirty: list[pygame.Rect] | None = None) -> None:
+        """Copy game_surface to the display -- all of it, or (when `dirty`
+        is given) only those regions, via pygame.display.update(rects)."""
         if not self.fullscreen:
-            self.screen.blit(self.game_surface, (0, 0))
+            if dirty is None:
+                self.screen.blit(self.game_surface, (0, 0))
+                pygame.display.flip()
+                return
+            for rect in dirty:
+                self.screen.blit(self.game_surface, rect, rect)
+            pygame.display.update(dirty)
+            return
+
+        if self.screen.get_size() != self._layout_size:
+            self._layout_fullscreen()
+        view = self._scale_target
+        scaled_into_screen = view.get_parent() is self.screen
+
+        if dirty is None:
+            for bar in self._letterbox:
+                self.screen.fill((0, 0, 0), bar)
+            self._scale_region(self.game_surface.get_rect(), view.get_rect())
+            if not scaled_into_screen:
+                self.screen.blit(view, self._view_rect)
             pygame.display.flip()
             return
 
+        regions = []
+        for rect in dirty:
+            rect = rect.clip(self.game_surface.get_rect())
+            if rect.width and rect.height:
+                regions.append((rect, self._scaled_rect(rect).clip(view.get_rect())))
+        if self._integer_scale is None:
+            # A non-integer factor doesn't map region edges onto whole
+            # pixels, so scaling regions separately would leave seams --
+            # scale the whole frame and copy out just the dirty parts.
+            self._scale_region(self.game_surface.get_rect(), view.get_rect())
+        else:
+            for rect, scaled_rect in regions:
+                self._scale_region(rect, scaled_rect)
+
+        screen_rects = []
+        for _, scaled_rect in regions:
+            screen_rect = scaled_rect.move(self._view_rect.topleft)
+            if not scaled_into_screen:
+                self.screen.blit(view, screen_rect, scaled_rect)
+            screen_rects.append(screen_rect)
+        pygame.display.update(screen_rects)
+
+    def _layout_fullscreen(self) -> None:
+        """Work out where game_surface lands on the current fullscreen
+        display: the scale factor, the centered view rect, the letterbox
+        bars around it, and the surface to scale into. Redone only when the
+        display size changes (or after _toggle_fullscreen()), not per frame."""
         target_w, target_h = self.screen.get_size()
         scale = min(target_w / settings.WINDOW_WIDTH, target_h / settings.WINDOW_HEIGHT)
+        self._integer_scale = None
+        if settings.FULLSCREEN_INTEGER_SCALE and scale >= 1:
+            self._integer_scale = math.floor(scale)
+            scale = self._integer_scale
+        self._scale = scale
         scaled_size = (round(settings.WINDOW_WIDTH * scale), round(settings.WINDOW_HEIGHT * scale))
+        view = pygame.Rect(((target_w - scaled_size[0]) // 2, (target_h - scaled_size[1]) // 2), scaled_size)
+        self._view_rect = view
+
+        # Letterbox bars when the aspect ratio (or an integer scale) doesn't
+        # fill the display -- only ever these get filled, never the whole screen.
+        bars = [
+            pygame.Rect(0, 0, target_w, view.top),
+            pygame.Rect(0, view.bottom, target_w, target_h - view.bottom),
+            pygame.Rect(0, view.top, view.left, view.height),
+            pygame.Rect(view.right, view.top, target_w - view.right, view.height),
+        ]
+        self._letterbox = [bar for bar in bars if bar.width and bar.height]
+
+        # transform.scale() can write straight onto the display through a
+        # subsurface, skipping a full-screen copy -- as long as the pixel
+        # sizes match, which they do on any ordinary desktop mode. Otherwise
+        # scale into a buffer of game_surface's format and blit that.
+        if self.screen.get_bytesize() == self.game_surface.get_bytesize():
+            self._scale_target = self.screen.subsurface(view)
+        else:
+            self._scale_target = pygame.Surface(scaled_size, 0, self.game_surface)
+        self._layout_size = (target_w, target_h)
+
+    def _scaled_rect(self, rect: pygame.Rect) -> pygame.Rect:
+        """`rect` in game_surface pixels -> the view pixels it covers."""
+        left = math.floor(rect.left * self._scale)
+        top = math.floor(rect.top * self._scale)
+        return pygame.Rect(
+            left,
+            top,
+            math.ceil(rect.right * self._scale) - left,
+            math.ceil(rect.bottom * self._scale) - top,
+        )
+
+    def _scale_region(self, rect: pygame.Rect, scaled_rect: pygame.Rect) -> None:
         # Nearest-neighbor, matching every other scale in this codebase --
         # crisp pixel edges rather than a blurry smoothscale.
-        scaled = pygame.transform.scale(self.game_surface, scaled_size)
-        self.screen.fill((0, 0, 0))  # letterbox bars when the aspect ratio doesn't match
-        self.screen.blit(scaled, ((target_w - scaled_size[0]) // 2, (target_h - scaled_size[1]) // 2))
-        pygame.display.flip()
+        source = self.game_surface if rect == self.game_surface.get_rect() else self.game_surface.subsurface(rect)
+        target = self._scale_target
+        if scaled_rect != target.get_rect():
+            target = target.subsurface(scaled_rect)
+        if self._integer_scale is None:
+            pygame.transform.scale(source, scaled_rect.size, target)
+        else:
+            pygame.transform.scale_by(source, self._integer_scale, target)
+
+    def _toggle_profiler(self) -> None:
+        if self._profiler_overlay is None:
+            profiling.reset()
+            profiling.enable()
+            self._profiler_overlay = ProfilerOverlay()
+        else:
+            profiling.disable()
+            self._profiler_overlay = None
+            self._drawn_scene = None  # redraw whatever the overlay covered
 
     def _toggle_fullscreen(self) -> None:
         self.fullscreen = not self.fullscreen
+        self._drawn_scene = None
+        self._layout_size = None  # the old subsurface belongs to the old display surface
+        self._scale_target = None
         if self.fullscreen:
             self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
         else:
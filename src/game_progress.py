@@ -4,7 +4,9 @@ unlocked yet, and where she last checkpointed.
 Everything else (Player, GameplayScene, the beast, hazards) gets rebuilt
 fresh on every room transition and every respawn. This is the one thing
 that doesn't -- constructed once in Game.__init__ (fresh, or loaded from
-disk) and threaded through every scene constructor from there on.
+disk) and threaded through every scene constructor from there on. It counts its
+own changes (`version`), so the HUD redraws only when something it shows
+has moved.
 """
 
 from __future__ import annotations
@@ -20,3 +22,16 @@ class GameProgress:
     current_hearts: int = settings.STARTING_MAX_HEARTS
     absorption_unlocked: bool = False
     checkpoint_room_key: str = "WAKING_HOLLOW"
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in self.__dict__ and self.__dict__[name] == value:
+            return
+        super().__setattr__(name, value)
+        super().__setattr__("_version", self.__dict__.get("_version", 0) + 1)
+
+    @property
+    def version(self) -> int:
+        """Goes up whenever any field actually changes -- what's drawn
+        from progress (see hud.py) compares this instead of every field.
+        Not a field itself, so saves and replays never see it."""
+        return self._version
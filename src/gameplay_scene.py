@@ -3,15 +3,20 @@
 Room-data-driven so one scene class covers every room instead of a
 subclass per beat. `room_data` (see data/rooms.py) opts into extra
 behavior purely by including certain optional keys:
-  - "enemy_spawn" / "enemy_patrol_bounds": spawns an Enemy if present.
+  - "enemies": [(x, y, patrol_left, patrol_right), ...] -- spawns an
+    Enemy at each (x, y), patrolling between the two x bounds. A room
+    with just one can give "enemy_spawn" (x, y) and "enemy_patrol_bounds"
+    (left, right) instead, which is read only when "enemies" is absent.
   - "hazards": [(x, y), ...] -- spawns a CorruptedPlant at each point.
+    (Both kinds live in column stores, EnemyStore / PlantStore, which take
+    any number of actors -- see src/entity_store.py.)
   - "attack_beast_spawn": (x, y) -- spawns an AttackBeast. Contact during
     its strike costs a heart (see _apply_beast_hit) -- except the first
     time it would take her last heart, which becomes the absorption-unlock
     beat instead of a death.
   - "exit_zone": (x, y, w, h) -- while the player stands in it: if
-    "next_room" is also present, transitions to a fresh GameplayScene for
-    it; otherwise shows a placeholder overlay (there's nowhere to go yet).
+    "next_room" (a room key) is also present, transitions to a fresh
+    GameplayScene for that room; otherwise shows a placeholder overlay (there's nowhere to go yet).
   - "checkpoint_zone": (x, y, w, h) -- entering it (edge-triggered, not
     every frame she stands in it) heals to full and saves to disk.
   - "reveal_zone": (x, y, w, h) -- unlike exit_zone, this always leaves
@@ -27,63 +32,88 @@ Takes a GameProgress alongside room_data -- hearts, whether absorption is
 unlocked, and the checkpoint all outlive any single room, so they're
 threaded through every transition (next_room, respawn) rather than living
 here.
+
+`input_source`, when set, replaces the keyboard: update() calls it once
+per step for that step's PlayerInput. It's how tools/simulate_headless.py
+drives a room with a scripted input sequence, and it carries over to the
+next room on a transition the same way `progress` does. `recorder` (see
+src/replay.py) is the other direction: every step's input and dt get
+written out, and together with `seed` -- the only randomness a room uses
+-- that's enough to replay the run exactly.
 """
 
 from __future__ import annotations
 
+import random
+from collections.abc import Callable
+
 import pygame
 
 import audio
+import prefetch
+import profiling
+import room_store
 import save_system
 import settings
 from attack_beast import AttackBeast
 from camera import Camera
 from cutscene_master import CutsceneMasterScene
-from enemy import Enemy
+from enemy import EnemyStore
 from game_progress import GameProgress
-from hazard import CorruptedPlant
+from hazard import PlantStore
+from hud import Hud
 from input import PlayerInput
 from level import Room
 from pause_menu import PauseMenuScene
 from player import Player
-from rooms import ROOM_REGISTRY
 from scene import Scene
-from sprite_utils import load_sprite
+from sprite_utils import faded_frame, load_sprite
+from text_render import get_font, render_text
+
+# Every sprite a room can ask for. Game keeps these preloaded for the whole
+# session (sprite_utils.preload_sprites), so building a scene -- on every
+# room change and every respawn -- never decodes or scales an image.
+GAMEPLAY_SPRITES = ("hatchling", "heart", "enemy", "undergrowth")
 
 
 class GameplayScene(Scene):
-    def __init__(self, room_data: dict, progress: GameProgress):
+    def __init__(self, room_data: dict, progress: GameProgress, seed: int | None = None):
         self.room = Room(room_data)
         self.room_key = room_data["key"]
         self.progress = progress
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
         self.camera = Camera(self.room.world_width, self.room.world_height)
 
         audio.play_track(room_data.get("music", "exploration"))
 
         self.player = Player(load_sprite("hatchling"), *self.room.player_spawn)
 
-        self.enemy: Enemy | None = None
-        if "enemy_spawn" in room_data:
-            enemy_sprite = load_sprite("enemy")
-            self.enemy = Enemy(
-                enemy_sprite, *room_data["enemy_spawn"], room_data["enemy_patrol_bounds"]
+        self.enemies: EnemyStore | None = None
+        enemies = room_data.get("enemies")
+        if enemies is None and "enemy_spawn" in room_data:
+            enemies = [(*room_data["enemy_spawn"], *room_data["enemy_patrol_bounds"])]
+        if enemies:
+            self.enemies = EnemyStore(
+                load_sprite("enemy"),
+                [(x, y) for x, y, _, _ in enemies],
+                [(left, right) for _, _, left, right in enemies],
             )
 
-        self.hazards: list[CorruptedPlant] = []
+        self.hazards: PlantStore | None = None
         if "hazards" in room_data:
-            hazard_sprite = load_sprite("undergrowth")
-            self.hazards = [
-                CorruptedPlant(hazard_sprite, spawn_x, spawn_y)
-                for spawn_x, spawn_y in room_data["hazards"]
-            ]
+            self.hazards = PlantStore(load_sprite("undergrowth"), room_data["hazards"])
 
         self.attack_beast: AttackBeast | None = None
         if "attack_beast_spawn" in room_data:
             beast_sprite = load_sprite("enemy")
-            self.attack_beast = AttackBeast(beast_sprite, *room_data["attack_beast_spawn"])
+            self.attack_beast = AttackBeast(beast_sprite, *room_data["attack_beast_spawn"], self.rng)
 
         self.exit_zone = pygame.Rect(*room_data["exit_zone"]) if "exit_zone" in room_data else None
-        self.next_room_data = room_data.get("next_room")
+        self.next_room_key: str | None = room_data.get("next_room")
+        # Keeps this room and the respawn room warm, and drops rooms that
+        # are now far away in the room graph -- see prefetch.py.
+        prefetch.enter_room(self.room_key, progress.checkpoint_room_key)
 
         self.checkpoint_zone = (
             pygame.Rect(*room_data["checkpoint_zone"]) if "checkpoint_zone" in room_data else None
@@ -100,16 +130,18 @@ class GameplayScene(Scene):
         self.tutorial_prompt = room_data.get("tutorial_prompt")
         self._log_prompt_cleared = False
 
-        self._heart_sprite = load_sprite("heart")
+        self._hud = Hud(progress)
 
-        self._font = pygame.font.Font(None, 22)
-        self._banner_font = pygame.font.Font(None, 26)
+        self._font = get_font(22)
+        self._banner_font = get_font(26)
         self._jump_pressed_this_frame = False
         self._dodge_pressed_this_frame = False
         self._attack_pressed_this_frame = False
         self._pause_requested = False
         self._unlock_banner_timer = 0.0
         self._respawn_requested = False
+        self.input_source: Callable[[], PlayerInput] | None = None
+        self.recorder = None  # replay.InputRecorder | None
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -127,7 +159,9 @@ class GameplayScene(Scene):
             self._pause_requested = False
             return PauseMenuScene(self)
 
-        player_input = self._read_input()
+        player_input = self.input_source() if self.input_source is not None else self._read_input()
+        if self.recorder is not None:
+            self.recorder.record(self, dt, player_input)
         self._jump_pressed_this_frame = False
         self._dodge_pressed_this_frame = False
         self._attack_pressed_this_frame = False
@@ -140,43 +174,59 @@ class GameplayScene(Scene):
         if self.attack_beast is not None and self.player.is_absorbing:
             actor_dt = dt * settings.UNLOCK_SLOW_MOTION_FACTOR
 
-        self.player.update(actor_dt, player_input, self.room.solids)
-        self._clamp_player_to_world()
+        with profiling.zone("player"):
+            self.player.update(actor_dt, player_input, self.room.collision)
+            self._clamp_player_to_world()
 
-        if self.enemy is not None:
-            self.enemy.update(dt, self.room.solids)
-            self._check_absorption()
+        with profiling.zone("enemies"):
+            if self.enemies is not None:
+                self.enemies.update(dt, self.room.collision)
+                self._check_absorption()
 
-        if self.attack_beast is not None:
-            self.attack_beast.update(actor_dt, self.room.solids, self.player.rect)
-            self._check_beast_strike()
+        with profiling.zone("beast"):
+            if self.attack_beast is not None:
+                self.attack_beast.update(actor_dt, self.room.collision, self.player.rect)
+                self._check_beast_strike()
 
-        self._update_hazards(dt)
+        with profiling.zone("hazards"):
+            self._update_hazards(dt)
         self._update_log_prompt()
         self._update_checkpoint()
         if self._unlock_banner_timer > 0:
             self._unlock_banner_timer = max(0.0, self._unlock_banner_timer - dt)
 
-        player_center_x = self.player.x + self.player.width / 2
-        player_center_y = self.player.y + self.player.height / 2
-        self.camera.update(player_center_x, player_center_y, dt)
+        with profiling.zone("camera"):
+            player_center_x = self.player.x + self.player.width / 2
+            player_center_y = self.player.y + self.player.height / 2
+            self.camera.update(player_center_x, player_center_y, dt)
+
+        # Starts loading whatever's past an exit she's nearing, so building
+        # the next scene when she steps into it doesn't stall the frame.
+        prefetch.update(self.player.rect)
 
         if self._respawn_requested:
-            checkpoint_room = ROOM_REGISTRY[self.progress.checkpoint_room_key]
-            return GameplayScene(checkpoint_room, self.progress)
+            return self._enter_room(room_store.load_room(self.progress.checkpoint_room_key))
 
         if self.reveal_zone is not None and self.player.rect.colliderect(self.reveal_zone):
             return CutsceneMasterScene(self.progress)
 
         if (
             self.exit_zone is not None
-            and self.next_room_data is not None
+            and self.next_room_key is not None
             and self.player.rect.colliderect(self.exit_zone)
         ):
-            return GameplayScene(self.next_room_data, self.progress)
+            return self._enter_room(room_store.load_room(self.next_room_key))
 
         return None
 
+    def _enter_room(self, room_data: dict) -> GameplayScene:
+        # The next room's seed comes from this one's RNG, so a whole
+        # multi-room run still hangs off the first room's seed alone.
+        scene = GameplayScene(room_data, self.progress, seed=self.rng.randrange(2**32))
+        scene.input_source = self.input_source
+        scene.recorder = self.recorder
+        return scene
+
     def _read_input(self) -> PlayerInput:
         keys = pygame.key.get_pressed()
         return PlayerInput(
@@ -193,12 +243,13 @@ class GameplayScene(Scene):
         self.player.x = max(0.0, min(self.player.x, max_x))
 
     def _check_absorption(self) -> None:
-        assert self.enemy is not None
-        if self.player.is_locked or not self.enemy.alive or self.enemy.being_absorbed:
+        assert self.enemies is not None
+        if self.player.is_locked:
             return
-        if self.player.rect.colliderect(self.enemy.rect):
+        enemy = self.enemies.first_touching(self.player.rect)
+        if enemy is not None:
             self.player.start_absorb()
-            self.enemy.begin_absorbed()
+            enemy.begin_absorbed()
             audio.play_sfx("absorb")
 
     def _check_beast_strike(self) -> None:
@@ -247,10 +298,9 @@ class GameplayScene(Scene):
         self._was_in_checkpoint_zone = now_in
 
     def _update_hazards(self, dt: float) -> None:
-        for hazard in self.hazards:
-            hazard.update(dt, self.player.rect)
-            if hazard.alive and not hazard.dying and self.player.rect.colliderect(hazard.rect):
-                hazard.begin_dying()
+        # Wither and contact for every plant in one pass -- see PlantStore.
+        if self.hazards is not None:
+            self.hazards.update(dt, self.player.rect)
 
     def _update_log_prompt(self) -> None:
         if self.log_obstacle is None or self._log_prompt_cleared:
@@ -265,37 +315,35 @@ class GameplayScene(Scene):
         return abs(self.player.rect.centerx - self.log_obstacle.centerx) < near_distance
 
     def draw(self, surface: pygame.Surface) -> None:
+        # Everything that moves is drawn blended between the last two
+        # simulation steps (see settings.FIXED_TIMESTEP) -- the camera
+        # included, or the world would shimmer against it.
+        alpha = self.render_alpha
+        self.camera.interpolate(alpha)
+
         surface.fill(settings.COLOR_BACKGROUND)
         self.room.draw(surface, self.camera)
-        if self.enemy is not None:
-            self.enemy.draw(surface, self.camera)
+        if self.enemies is not None:
+            self.enemies.draw(surface, self.camera, alpha)
         if self.attack_beast is not None:
-            self.attack_beast.draw(surface, self.camera)
-        for hazard in self.hazards:
-            hazard.draw(surface, self.camera)
-        self.player.draw(surface, self.camera)
+            self.attack_beast.draw(surface, self.camera, alpha)
+        if self.hazards is not None:
+            self.hazards.draw(surface, self.camera)
+        self.player.draw(surface, self.camera, alpha)
 
         if self._should_show_log_prompt():
             self._draw_prompt_above_player(surface)
         if (
             self.exit_zone is not None
-            and self.next_room_data is None
+            and self.next_room_key is None
             and self.player.rect.colliderect(self.exit_zone)
         ):
             self._draw_exit_overlay(surface)
 
-        self._draw_hearts_hud(surface)
+        self._hud.draw(surface)
         if self._unlock_banner_timer > 0:
             self._draw_unlock_banner(surface)
 
-    def _draw_hearts_hud(self, surface: pygame.Surface) -> None:
-        for i in range(self.progress.max_hearts):
-            frame_name = "full" if i < self.progress.current_hearts else "empty"
-            frame = self._heart_sprite.get(frame_name)
-            x = settings.HEART_ICON_MARGIN + i * settings.HEART_ICON_SPACING
-            y = settings.HEART_ICON_MARGIN
-            surface.blit(frame, (x, y))
-
     def _draw_unlock_banner(self, surface: pygame.Surface) -> None:
         fade_tail = 0.6
         alpha = 255 if self._unlock_banner_timer >= fade_tail else round(
@@ -308,20 +356,19 @@ class GameplayScene(Scene):
         icon_rect = icon_surface.get_rect(center=(settings.WINDOW_WIDTH // 2, 54))
         surface.blit(icon_surface, icon_rect)
 
-        text_surface = self._banner_font.render("-- absorption unlocked --", True, (235, 230, 210))
-        text_surface.set_alpha(alpha)
+        text_surface = render_text(self._banner_font, "-- absorption unlocked --", (235, 230, 210))
+        text_surface = faded_frame(text_surface, alpha)
         text_rect = text_surface.get_rect(center=(settings.WINDOW_WIDTH // 2, 88))
         surface.blit(text_surface, text_rect)
 
     def _draw_prompt_above_player(self, surface: pygame.Surface) -> None:
-        text_surface = self._font.render(self.tutorial_prompt, True, (230, 230, 230))
-        player_top_x, player_top_y = self.camera.apply(
-            self.player.x + self.player.width / 2, self.player.y
-        )
+        text_surface = render_text(self._font, self.tutorial_prompt, (230, 230, 230))
+        player_x, player_y = self.player.render_position(self.render_alpha)
+        player_top_x, player_top_y = self.camera.apply(player_x + self.player.width / 2, player_y)
         rect = text_surface.get_rect(midbottom=(round(player_top_x), round(player_top_y) - 12))
         surface.blit(text_surface, rect)
 
     def _draw_exit_overlay(self, surface: pygame.Surface) -> None:
-        text_surface = self._font.render("-- end of vertical slice --", True, (230, 230, 230))
+        text_surface = render_text(self._font, "-- end of vertical slice --", (230, 230, 230))
         rect = text_surface.get_rect(center=(settings.WINDOW_WIDTH // 2, 60))
         surface.blit(text_surface, rect)
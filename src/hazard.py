@@ -4,67 +4,171 @@ Stationary, has no effect on the player, and reacts to her presence rather
 than her deliberate action: it withers (reversibly) if she lingers nearby,
 and recoils and quietly dies if she touches it -- no lock, no flash, no
 sound. Kept separate from Enemy since none of that behavior overlaps.
+
+A room's plants all live in one PlantStore (see entity_store.py), whose
+update() is the whole hazard field in one vectorised pass -- death fades,
+wither flags and contact hits for every plant at once -- so a room
+carpeted with undergrowth costs about what a room with two plants does.
 """
 
 from __future__ import annotations
 
+import numpy as np
 import pygame
 
 import settings
-from sprite_utils import SpriteSheet
+from entity_store import ROW_LOOP_MAX_ROWS, EntityStore
+from sprite_utils import SpriteSheet, faded_frame
+
+PLANT_DTYPE = np.dtype(
+    [
+        ("x", np.float64),
+        ("y", np.float64),
+        # Its collision box in whole pixels, as its rect would give it --
+        # plants never move, so this is worked out once.
+        ("left", np.int64),
+        ("top", np.int64),
+        ("center_x", np.int64),
+        ("alive", np.bool_),
+        ("is_withered", np.bool_),
+        ("dying", np.bool_),
+        ("death_timer", np.float64),
+    ]
+)
 
 
 class CorruptedPlant:
-    def __init__(self, sprite: SpriteSheet, spawn_x: float, spawn_y: float):
-        self.sprite = sprite
-        # Collision size is fixed (settings.HAZARD_COLLISION_*), independent
-        # of the sprite's actual pixel size -- see settings.py.
-        self.width = settings.HAZARD_COLLISION_WIDTH
-        self.height = settings.HAZARD_COLLISION_HEIGHT
+    """One plant: a view onto its PlantStore row."""
 
-        # spawn position is its base; store the top-left corner for drawing.
-        self.x = float(spawn_x - self.width / 2)
-        self.y = float(spawn_y - self.height)
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: PlantStore, index: int):
+        self._store = store
+        self._index = index
+
+    @property
+    def x(self) -> float:
+        return float(self._store.data["x"][self._index])
+
+    @property
+    def y(self) -> float:
+        return float(self._store.data["y"][self._index])
+
+    @property
+    def alive(self) -> bool:
+        return bool(self._store.data["alive"][self._index])
+
+    @property
+    def is_withered(self) -> bool:
+        return bool(self._store.data["is_withered"][self._index])
 
-        self.alive = True
-        self.is_withered = False
-        self.dying = False
-        self.death_timer = 0.0
+    @property
+    def dying(self) -> bool:
+        return bool(self._store.data["dying"][self._index])
 
     @property
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(round(self.x), round(self.y), self.width, self.height)
+        """Its collision box: a copy of the store's, built once (plants
+        never move) -- the caller's to keep or modify."""
+        return self._store.rects[self._index].copy()
 
     def begin_dying(self) -> None:
         """Contact: recoil and quietly fade, with no effect on the player."""
-        self.dying = True
-        self.death_timer = settings.HAZARD_DEATH_FADE_DURATION
+        row = self._store.data[self._index]
+        row["dying"] = True
+        row["death_timer"] = settings.HAZARD_DEATH_FADE_DURATION
 
-    def update(self, dt: float, player_rect: pygame.Rect) -> None:
-        if not self.alive:
-            return
 
-        if self.dying:
-            self.death_timer -= dt
-            if self.death_timer <= 0:
-                self.alive = False
-            return
+class PlantStore(EntityStore):
+    DTYPE = PLANT_DTYPE
+    VIEW = CorruptedPlant
+    # Collision size is fixed (settings.HAZARD_COLLISION_*), independent of
+    # the sprite's actual pixel size -- see settings.py.
+    WIDTH = settings.HAZARD_COLLISION_WIDTH
+    HEIGHT = settings.HAZARD_COLLISION_HEIGHT
 
-        distance = abs(player_rect.centerx - self.rect.centerx)
-        self.is_withered = distance < settings.HAZARD_WITHER_RADIUS
+    def __init__(self, sprite: SpriteSheet, spawns: list[tuple[float, float]]):
+        super().__init__(sprite, len(spawns))
+        # spawn position is its base; store the top-left corner for drawing.
+        self._place_feet(spawns)
+        data = self.data
+        data["left"] = np.round(data["x"])
+        data["top"] = np.round(data["y"])
+        data["center_x"] = data["left"] + self.width // 2
 
-    def draw(self, surface: pygame.Surface, camera) -> None:
-        if not self.alive:
+    def update(self, dt: float, player_rect: pygame.Rect) -> None:
+        """One step for every plant: death fades tick, the rest wither or
+        recover by her distance, and any she's touching start dying."""
+        if len(self.data) <= ROW_LOOP_MAX_ROWS:
+            self._update_rows(dt, player_rect)
             return
 
-        frame_name = "withered" if (self.is_withered or self.dying) else "intact"
-        frame = self.sprite.get(frame_name)
-        if self.dying:
-            frame = frame.copy()
-            fade = max(0.0, self.death_timer / settings.HAZARD_DEATH_FADE_DURATION)
-            frame.set_alpha(round(255 * fade))
-
-        draw_x = self.x - (frame.get_width() - self.width) / 2
-        draw_y = self.y - (frame.get_height() - self.height)
-        screen_x, screen_y = camera.apply(draw_x, draw_y)
-        surface.blit(frame, (round(screen_x), round(screen_y)))
+        data = self.data
+        # Death fade: tick down, and drop out once it's done.
+        dying = data["alive"] & data["dying"]
+        timers = data["death_timer"]
+        timers[dying] -= dt
+        data["alive"][dying & (timers <= 0)] = False
+
+        # Wither while she's within reach, recover once she leaves.
+        standing = data["alive"] & ~dying
+        near = np.abs(player_rect.centerx - data["center_x"]) < settings.HAZARD_WITHER_RADIUS
+        data["is_withered"][standing] = near[standing]
+
+        touched = (
+            standing
+            & (data["left"] < player_rect.right)
+            & (data["left"] + self.width > player_rect.left)
+            & (data["top"] < player_rect.bottom)
+            & (data["top"] + self.height > player_rect.top)
+        )
+        data["dying"][touched] = True
+        data["death_timer"][touched] = settings.HAZARD_DEATH_FADE_DURATION
+
+    def _update_rows(self, dt: float, player_rect: pygame.Rect) -> None:
+        """update(), one row at a time. Most steps change nothing, so a
+        row's fields are written back only when they do."""
+        data = self.data
+        for index, row in enumerate(data.tolist()):
+            # Field order is PLANT_DTYPE's.
+            _, _, _, _, center_x, alive, is_withered, dying, timer = row
+            if not alive:
+                continue
+            if dying:
+                timer -= dt
+                data["death_timer"][index] = timer
+                if timer <= 0:
+                    data["alive"][index] = False
+                continue
+            near = abs(player_rect.centerx - center_x) < settings.HAZARD_WITHER_RADIUS
+            if near != is_withered:
+                data["is_withered"][index] = near
+            if self.rects[index].colliderect(player_rect):
+                data["dying"][index] = True
+                data["death_timer"][index] = settings.HAZARD_DEATH_FADE_DURATION
+
+    def draw(self, surface: pygame.Surface, camera) -> None:
+        data = self.data
+        # Only plants whose box is within a sprite's width of the view --
+        # the frames overhang the box a little, never by that much.
+        view_left, view_top = camera.apply(0, 0)
+        margin = max(self.width, self.height)
+        visible = (
+            data["alive"]
+            & (data["left"] + view_left < surface.get_width() + margin)
+            & (data["left"] + view_left + self.width > -margin)
+            & (data["top"] + view_top < surface.get_height() + margin)
+            & (data["top"] + view_top + self.height > -margin)
+        )
+        for index in np.flatnonzero(visible).tolist():
+            dying = data["dying"][index]
+            frame_name = "withered" if (data["is_withered"][index] or dying) else "intact"
+            frame = self.sprite.get(frame_name)
+            if dying:
+                fade = max(0.0, float(data["death_timer"][index]) / settings.HAZARD_DEATH_FADE_DURATION)
+                frame = faded_frame(frame, 255 * fade)
+
+            draw_x = float(data["x"][index]) - (frame.get_width() - self.width) / 2
+            draw_y = float(data["y"][index]) - (frame.get_height() - self.height)
+            screen_x, screen_y = camera.apply(draw_x, draw_y)
+            surface.blit(frame, (round(screen_x), round(screen_y)))
@@ -0,0 +1,45 @@
+"""The gameplay HUD: everything drawn over the world in screen space that
+comes from GameProgress -- so far the row of hearts.
+
+It changes on a hit, a checkpoint or the absorption unlock, and otherwise
+sits still for minutes, so it's composited into one cached surface and
+rebuilt only when GameProgress.version says something moved. A frame is
+one blit however many icons or counters the HUD grows to hold; anything
+new (mana, an absorbed count) belongs in _build().
+"""
+
+from __future__ import annotations
+
+import pygame
+
+import settings
+from game_progress import GameProgress
+from sprite_utils import load_sprite
+
+
+class Hud:
+    def __init__(self, progress: GameProgress):
+        self.progress = progress
+        self._heart_sprite = load_sprite("heart")
+        self._surface: pygame.Surface | None = None
+        self._built_version: int | None = None
+
+    def _build(self) -> pygame.Surface:
+        """The whole HUD on a transparent surface whose top-left is the
+        HUD's margin corner of the screen."""
+        hearts = []
+        for i in range(self.progress.max_hearts):
+            frame_name = "full" if i < self.progress.current_hearts else "empty"
+            hearts.append((self._heart_sprite.get(frame_name), (i * settings.HEART_ICON_SPACING, 0)))
+        bounds = pygame.Rect(0, 0, 0, 0).unionall(
+            [frame.get_rect(topleft=position) for frame, position in hearts]
+        )
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        surface.blits(hearts, doreturn=False)
+        return surface
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if self._built_version != self.progress.version:
+            self._surface = self._build()
+            self._built_version = self.progress.version
+        surface.blit(self._surface, (settings.HEART_ICON_MARGIN, settings.HEART_ICON_MARGIN))
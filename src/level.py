@@ -3,28 +3,238 @@ the game can collide with and draw."""
 
 from __future__ import annotations
 
+from functools import partial
+from pathlib import Path
+
 import pygame
 
-from settings import COLOR_GROUND, COLOR_PLATFORM, PROJECT_ROOT
+import asset_loader
+from physics import CollisionWorld, Slope
+from settings import COLOR_GROUND, COLOR_PLATFORM, PROJECT_ROOT, WINDOW_HEIGHT
 
 COLOR_LIGHT_SHAFT = (68, 62, 48)
 # Distinct from COLOR_LIGHT_SHAFT on purpose -- warm and out of place
 # against the grey-black palette everywhere else, per Beat 5's "the first
 # 'different' thing she's encountered."
 COLOR_WARM_GLOW = (196, 122, 54)
+# A shade lighter than COLOR_PLATFORM, so a platform she can jump up
+# through reads differently from one she'd bump her head on.
+COLOR_ONE_WAY_PLATFORM = (108, 100, 90)
 BACKGROUNDS_DIR = PROJECT_ROOT / "assets" / "backgrounds"
+# Room geometry is rendered once into cached square chunks this size, and
+# each frame only blits the chunks the camera can see -- see StaticLayer.
+STATIC_CHUNK_SIZE = 512
+# Fills a chunk's empty space; never one of the palette's colors.
+_CHUNK_COLORKEY = (255, 0, 255)
+
+
+def background_path(name: str) -> Path:
+    """Where a room's "background" key points -- read by bake_room()."""
+    return BACKGROUNDS_DIR / f"{name}.png"
+
+
+def _bounds(points: list[tuple[int, int]]) -> pygame.Rect:
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    return pygame.Rect(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+
+
+def _paint(
+    target: pygame.Surface,
+    offset: tuple[int, int],
+    shapes: list[tuple[pygame.Rect, tuple[int, int, int]]],
+    polygons: list[tuple[list[tuple[int, int]], tuple[int, int, int]]],
+) -> None:
+    """Draw world-space shapes onto `target`, whose top-left is world
+    `offset` -- rects first, in order, then polygons."""
+    offset_x, offset_y = offset
+    for rect, color in shapes:
+        pygame.draw.rect(target, color, rect.move(-offset_x, -offset_y))
+    for points, color in polygons:
+        pygame.draw.polygon(target, color, [(x - offset_x, y - offset_y) for x, y in points])
+
+
+class StaticLayer:
+    """Geometry that never moves, drawn as cached chunk surfaces.
+
+    `shapes` are (rect, color) pairs in world space, `polygons` (points,
+    color) pairs -- slopes, say. Each STATIC_CHUNK_SIZE
+    square of the world is rendered the first time the camera sees it --
+    empty chunks are remembered as None and never drawn -- so a frame costs
+    a few whole-chunk blits however many shapes the room has. Chunks are
+    color-keyed with RLE acceleration: mostly-empty chunks (the usual case)
+    blit at a fraction of a plain surface's cost.
+    """
+
+    def __init__(
+        self,
+        shapes: list[tuple[pygame.Rect, tuple[int, int, int]]],
+        polygons: list[tuple[list[tuple[int, int]], tuple[int, int, int]]] = (),
+    ):
+        self._shapes = shapes
+        self._polygons = [(_bounds(points), points, color) for points, color in polygons]
+        self._chunks: dict[tuple[int, int], pygame.Surface | None] = {}
+
+    def _chunk(self, column: int, row: int) -> pygame.Surface | None:
+        key = (column, row)
+        if key in self._chunks:
+            return self._chunks[key]
+        size = STATIC_CHUNK_SIZE
+        area = pygame.Rect(column * size, row * size, size, size)
+        chunk = None
+        shapes = [(rect, color) for rect, color in self._shapes if rect.colliderect(area)]
+        polygons = [(points, color) for bounds, points, color in self._polygons if bounds.colliderect(area)]
+        if shapes or polygons:
+            chunk = pygame.Surface(area.size).convert()
+            chunk.fill(_CHUNK_COLORKEY)
+            _paint(chunk, area.topleft, shapes, polygons)
+            chunk.set_colorkey(_CHUNK_COLORKEY, pygame.RLEACCEL)
+        self._chunks[key] = chunk
+        return chunk
+
+    def draw(self, surface: pygame.Surface, origin: tuple[int, int]) -> None:
+        """Blit every chunk overlapping the view; `origin` is where world
+        (0, 0) lands on `surface` (Camera.screen_origin())."""
+        origin_x, origin_y = origin
+        view = pygame.Rect(-origin_x, -origin_y, *surface.get_size())
+        size = STATIC_CHUNK_SIZE
+        for row in range(view.top // size, (view.bottom - 1) // size + 1):
+            for column in range(view.left // size, (view.right - 1) // size + 1):
+                chunk = self._chunk(column, row)
+                if chunk is not None:
+                    surface.blit(chunk, (column * size + origin_x, row * size + origin_y))
+
+
+class BakedLayer:
+    """A room's background with all of its static geometry composited on
+    top, once, into one world-sized surface (bake_room()) -- so a frame is
+    a single viewport-sized blit however many shapes the room has.
+
+    Only for rooms with a background, which already hold a world-wide
+    surface; bare-geometry rooms (big tilemap rooms, say) stay in
+    StaticLayer's chunks. The surface is asset_loader's, cached under the
+    room's key: a respawn or re-entry reuses it, and prefetch.py has the
+    loader decode the next room's background on its worker thread before
+    she gets there, so only the bake itself is left for the main thread.
+    """
+
+    def __init__(self, surface: pygame.Surface):
+        self._surface = surface
+
+    def draw(self, surface: pygame.Surface, origin: tuple[int, int]) -> None:
+        """Blit the part inside the view; `origin` as for StaticLayer.draw."""
+        # Only the part inside the camera's view, via blit's `area` -- one
+        # viewport-sized copy whatever the room's width. (Splitting wide
+        # backgrounds into strips measured slower, not faster: SDL's blit
+        # is disproportionately slow on the narrow slivers a strip boundary
+        # leaves at the screen edge.)
+        origin_x, origin_y = origin
+        view = pygame.Rect(-origin_x, -origin_y, *surface.get_size()).clip(self._surface.get_rect())
+        if view.width and view.height:
+            surface.blit(self._surface, (view.x + origin_x, view.y + origin_y), view)
+
+
+def _slope_points(slope: Slope) -> list[tuple[int, int]]:
+    rect = slope.rect
+    peak = rect.topright if slope.rises_right else rect.topleft
+    return [rect.bottomleft, rect.bottomright, peak]
+
+
+def _geometry(
+    room_data: dict,
+) -> tuple[tuple[int, int], list[pygame.Rect], list[pygame.Rect], list[pygame.Rect], list[Slope]]:
+    """(world size, ground, platforms, one-way platforms, slopes), from a
+    compiled room -- a tilemap room arrives already merged into rects."""
+    world_size = (room_data["world_width"], room_data["world_height"])
+    # The ground is the first platform in the list by convention (a
+    # compiled tilemap room says how many of its leading rects are
+    # ground); everything else is drawn as a raised platform.
+    rects = [pygame.Rect(*p) for p in room_data["platforms"]]
+    ground_count = room_data.get("ground_count", 1)
+    ground, platforms = rects[:ground_count], rects[ground_count:]
+    one_way = [pygame.Rect(*p) for p in room_data.get("one_way_platforms", ())]
+    # (x, y, w, h, rise): rise 1 climbs to the right, -1 to the left.
+    slopes = [Slope(pygame.Rect(x, y, w, h), rise > 0) for x, y, w, h, rise in room_data.get("slopes", ())]
+    return world_size, ground, platforms, one_way, slopes
+
+
+def _static_shapes(
+    room_data: dict,
+    ground: list[pygame.Rect],
+    platforms: list[pygame.Rect],
+    one_way: list[pygame.Rect],
+    slopes: list[Slope],
+) -> tuple[
+    list[tuple[pygame.Rect, tuple[int, int, int]]], list[tuple[list[tuple[int, int]], tuple[int, int, int]]]
+]:
+    """Everything that never moves, as (shapes, polygons) in draw order:
+    the light shaft and warm glow sit behind the geometry."""
+    shapes = []
+    if "light_shaft" in room_data:
+        shapes.append((pygame.Rect(*room_data["light_shaft"]), COLOR_LIGHT_SHAFT))
+    if "warm_glow" in room_data:
+        shapes.append((pygame.Rect(*room_data["warm_glow"]), COLOR_WARM_GLOW))
+    shapes += [(rect, COLOR_GROUND) for rect in ground]
+    shapes += [(rect, COLOR_PLATFORM) for rect in platforms]
+    shapes += [(rect, COLOR_ONE_WAY_PLATFORM) for rect in one_way]
+    polygons = [(_slope_points(slope), COLOR_GROUND) for slope in slopes]
+    return shapes, polygons
+
+
+def _baked_extent(
+    background_size: tuple[int, int],
+    world_size: tuple[int, int],
+    shapes: list[tuple[pygame.Rect, tuple[int, int, int]]],
+) -> tuple[int, int]:
+    # The world, or more if a shape hangs off its edge (a glow past the
+    # right wall, say) -- still drawn wherever the camera could see it.
+    extent = pygame.Rect((0, 0), world_size).unionall(
+        [pygame.Rect((0, 0), background_size)] + [rect for rect, _ in shapes]
+    )
+    return extent.bottomright
+
+
+def baked_size(room_data: dict) -> tuple[int, int]:
+    """The size of bake_room()'s surface, without decoding anything --
+    what prefetch.py budgets for. Backgrounds are world_width x window
+    height (see Room)."""
+    world_size, *geometry = _geometry(room_data)
+    shapes, _ = _static_shapes(room_data, *geometry)
+    return _baked_extent((world_size[0], WINDOW_HEIGHT), world_size, shapes)
+
+
+def bake_room(room_data: dict, background: pygame.Surface) -> pygame.Surface:
+    """The room's freshly decoded `background` (see background_path()),
+    convert()ed with its static geometry painted on -- BakedLayer's
+    surface. Anything the background doesn't cover is color-keyed out, as
+    in a StaticLayer chunk. Draws, so main thread only: asset_loader runs
+    it from poll() or load_built()."""
+    world_size, *geometry = _geometry(room_data)
+    shapes, polygons = _static_shapes(room_data, *geometry)
+    size = _baked_extent(background.get_size(), world_size, shapes)
+    covered = background.get_size() == size
+    if covered:
+        baked = background.convert()
+    else:
+        baked = pygame.Surface(size).convert()
+        baked.fill(_CHUNK_COLORKEY)
+        baked.blit(background, (0, 0))
+    _paint(baked, (0, 0), shapes, polygons)
+    if not covered:
+        # Set once, after painting -- RLE-encoded surfaces are slow to draw on.
+        baked.set_colorkey(_CHUNK_COLORKEY, pygame.RLEACCEL)
+    return baked
 
 
 class Room:
     def __init__(self, room_data: dict):
-        self.world_width: int = room_data["world_width"]
-        self.world_height: int = room_data["world_height"]
         self.player_spawn: tuple[int, int] = room_data["player_spawn"]
 
-        self.solids: list[pygame.Rect] = [pygame.Rect(*p) for p in room_data["platforms"]]
-        # The ground is always the first platform in the list by convention;
-        # everything else is drawn as a raised platform.
-        self._ground = self.solids[0]
+        (self.world_width, self.world_height), ground, platforms, one_way, slopes = _geometry(room_data)
+        self.solids: list[pygame.Rect] = ground + platforms
+        # Built once here rather than per move_and_collide call -- the
+        # geometry never moves, and every actor queries it every frame.
+        self.collision = CollisionWorld(self.solids, one_way, slopes)
 
         self.light_shaft = (
             pygame.Rect(*room_data["light_shaft"]) if "light_shaft" in room_data else None
@@ -33,25 +243,19 @@ class Room:
             pygame.Rect(*room_data["warm_glow"]) if "warm_glow" in room_data else None
         )
 
-        # Generated once by tools/generate_room_backgrounds.py, sized to
-        # exactly world_width x window_height -- drawn 1:1 with world space
-        # (not parallax-scrolled), so it lines up with the room geometry
-        # without any extra scroll-speed math.
-        self.background: pygame.Surface | None = None
+        # Backgrounds are generated once by tools/generate_room_backgrounds.py,
+        # sized to exactly world_width x window_height -- drawn 1:1 with world
+        # space (not parallax-scrolled), so they line up with the room
+        # geometry without any extra scroll-speed math. Usually already baked
+        # by the time the room is built (see BakedLayer).
+        self._static_layer: StaticLayer | BakedLayer
         if "background" in room_data:
-            path = BACKGROUNDS_DIR / f"{room_data['background']}.png"
-            self.background = pygame.image.load(str(path)).convert()
+            baked = asset_loader.load_built(
+                room_data["key"], background_path(room_data["background"]), partial(bake_room, room_data)
+            )
+            self._static_layer = BakedLayer(baked)
+        else:
+            self._static_layer = StaticLayer(*_static_shapes(room_data, ground, platforms, one_way, slopes))
 
     def draw(self, surface: pygame.Surface, camera) -> None:
-        if self.background is not None:
-            screen_x, screen_y = camera.apply(0, 0)
-            surface.blit(self.background, (round(screen_x), round(screen_y)))
-
-        if self.light_shaft is not None:
-            pygame.draw.rect(surface, COLOR_LIGHT_SHAFT, camera.apply_rect(self.light_shaft))
-        if self.warm_glow is not None:
-            pygame.draw.rect(surface, COLOR_WARM_GLOW, camera.apply_rect(self.warm_glow))
-
-        for solid in self.solids:
-            color = COLOR_GROUND if solid is self._ground else COLOR_PLATFORM
-            pygame.draw.rect(surface, color, camera.apply_rect(solid))
+        self._static_layer.draw(surface, camera.screen_origin())
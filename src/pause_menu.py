@@ -12,6 +12,7 @@ import pygame
 import audio
 import settings
 from scene import Scene
+from text_render import get_font, render_text
 
 COLOR_DIM_OVERLAY = (0, 0, 0, 160)
 COLOR_MENU_TEXT = (215, 210, 200)
@@ -38,10 +39,14 @@ class PauseMenuScene(Scene):
         self.view = "main"  # "main" | "settings" | "hints"
         self.selected_index = 0
         self._resume_requested = False
+        # What the last draw() showed, and where the menu items sat --
+        # moving the selection only changes that block (see dirty_rects()).
+        self._drawn_state: tuple[str, int, float] | None = None
+        self._menu_rect: pygame.Rect | None = None
 
-        self._title_font = pygame.font.Font(None, 40)
-        self._item_font = pygame.font.Font(None, 30)
-        self._body_font = pygame.font.Font(None, 24)
+        self._title_font = get_font(40)
+        self._item_font = get_font(30)
+        self._body_font = get_font(24)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type != pygame.KEYDOWN:
@@ -84,7 +89,25 @@ class PauseMenuScene(Scene):
             return self.paused_scene
         return None
 
+    def _state(self) -> tuple[str, int, float]:
+        return (self.view, self.selected_index, audio.get_volume())
+
+    def dirty_rects(self) -> list[pygame.Rect] | None:
+        # The scene underneath is frozen, so the only things that ever
+        # change here are the menu's own view/selection/volume.
+        state = self._state()
+        if state == self._drawn_state:
+            return []
+        if (
+            self._drawn_state is not None
+            and self._menu_rect is not None
+            and state[0] == self._drawn_state[0] == "main"
+        ):
+            return [self._menu_rect]
+        return None
+
     def draw(self, surface: pygame.Surface) -> None:
+        self._drawn_state = self._state()
         self.paused_scene.draw(surface)
 
         overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
@@ -104,31 +127,36 @@ class PauseMenuScene(Scene):
             self._draw_body("Hints", HINTS_LINES, surface)
 
     def _draw_main_menu(self, surface: pygame.Surface) -> None:
-        title = self._title_font.render("Paused", True, COLOR_MENU_TEXT)
+        title = render_text(self._title_font, "Paused", COLOR_MENU_TEXT)
         title_rect = title.get_rect(centerx=settings.WINDOW_WIDTH // 2, top=140)
         surface.blit(title, title_rect)
 
         y = title_rect.bottom + 40
+        item_rects = []
         for index, item in enumerate(MAIN_ITEMS):
             color = COLOR_MENU_SELECTED if index == self.selected_index else COLOR_MENU_TEXT
             label = f"> {item}" if index == self.selected_index else item
-            text = self._item_font.render(label, True, color)
+            text = render_text(self._item_font, label, color)
             rect = text.get_rect(centerx=settings.WINDOW_WIDTH // 2, top=y)
             surface.blit(text, rect)
+            item_rects.append(rect)
             y += text.get_height() + 16
+        # Full-width rows: a label's width changes with its "> " marker.
+        menu_rect = item_rects[0].unionall(item_rects)
+        self._menu_rect = pygame.Rect(0, menu_rect.top, settings.WINDOW_WIDTH, menu_rect.height)
 
     def _draw_body(self, title: str, lines: list[str], surface: pygame.Surface) -> None:
-        title_surface = self._title_font.render(title, True, COLOR_MENU_TEXT)
+        title_surface = render_text(self._title_font, title, COLOR_MENU_TEXT)
         title_rect = title_surface.get_rect(centerx=settings.WINDOW_WIDTH // 2, top=140)
         surface.blit(title_surface, title_rect)
 
         y = title_rect.bottom + 30
         for line in lines:
-            text = self._body_font.render(line, True, COLOR_MENU_BODY_TEXT)
+            text = render_text(self._body_font, line, COLOR_MENU_BODY_TEXT)
             rect = text.get_rect(centerx=settings.WINDOW_WIDTH // 2, top=y)
             surface.blit(text, rect)
             y += text.get_height() + 10
 
-        hint = self._body_font.render("Esc / Enter -- back", True, COLOR_MENU_BODY_TEXT)
+        hint = render_text(self._body_font, "Esc / Enter -- back", COLOR_MENU_BODY_TEXT)
         hint_rect = hint.get_rect(centerx=settings.WINDOW_WIDTH // 2, top=y + 20)
         surface.blit(hint, hint_rect)
@@ -1,18 +1,55 @@
-"""Simple AABB collision resolution against a list of static solid rects.
+"""Simple AABB collision resolution against a room's static geometry.
 
 Movement is resolved one axis at a time (horizontal, then vertical) so
 sliding along a wall or landing on a floor/platform falls out naturally,
 without special-casing each direction.
+
+Pushing out only catches solids the box still overlaps where it lands, so
+a step longer than the box itself could carry it clean through a thin
+platform. Those steps are swept first instead: the box stops at the first
+solid face it would cross on the way (its time of impact along that
+axis), then resolves as usual. Shorter steps -- every step at normal
+speeds and SIMULATION_HZ -- can't skip a solid, so they skip the sweep.
+
+`solids` can be a plain list of rects (checked one by one), a
+`SpatialHash` of them, which only hands back the rects near the moving
+box, or a `CollisionWorld` -- what every room builds (`level.Room.collision`):
+its solids indexed, plus the two kinds of geometry that only hold a box up
+from above and never push it sideways or down:
+  - one-way (jump-through) platforms: a box moving down lands on one if its
+    bottom started the step at or above the platform's top; from below or
+    the side it passes straight through;
+  - slopes (see Slope): a box whose bottom started on or above the sloped
+    surface is stood on it -- walking uphill lifts it, walking downhill
+    keeps it on the surface rather than stepping off into a fall.
+Both are resolved from each box's edges, with integer arithmetic on the
+surface line -- no per-pixel checks -- so one slope replaces the dozens of
+stair-step rects a designer would otherwise fake it with.
+
+None of that machinery is paid for when it isn't needed: the sweep only
+runs for a step longer than the box, and the push-out passes find each
+overlapping solid with pygame's collidelist() rather than a Python loop,
+so a room with up to LINEAR_SCAN_MAX_SOLIDS solids -- every hand-authored
+room -- just scans them all and never builds the index.
+tools/benchmark_collision.py measures it against the original list-only
+implementation.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 
 import pygame
 
+SPATIAL_HASH_CELL_SIZE = 192  # px -- a few player-widths, so most queries touch 1-4 cells
+# Up to this many solids, collidelist() checking every one (in C) is
+# cheaper than the index's own bookkeeping; past ~300 the index wins.
+# Every hand-authored room so far sits well under it.
+LINEAR_SCAN_MAX_SOLIDS = 200
+
 
-@dataclass
+@dataclass(slots=True)
 class CollisionResult:
     touched_left: bool = False
     touched_right: bool = False
@@ -20,6 +57,331 @@ class CollisionResult:
     touched_bottom: bool = False
 
 
+@dataclass(frozen=True, slots=True)
+class Slope:
+    """A right-triangle floor filling the bottom of `rect`: its surface
+    runs corner to corner, from the bottom-left up to the top-right when
+    `rises_right`, else from the top-left down to the bottom-right.
+    The gradient is fixed by the rect's shape, and only the two the tile
+    art has are allowed: 45 degrees (height == width) and the half slope
+    usually called 22.5 degrees (twice as wide as high, i.e. 1:2)."""
+
+    rect: pygame.Rect
+    rises_right: bool
+
+    def __post_init__(self) -> None:
+        width, height = self.rect.size
+        if height <= 0 or width not in (height, 2 * height):
+            raise ValueError(f"slope {tuple(self.rect)}: must be 45 degrees (w == h) or 22.5 (w == 2h)")
+
+    def surface_y(self, box: pygame.Rect) -> int:
+        """The highest point of the surface under `box`'s span -- at its
+        uphill edge, clamped to the slope's ends (so a box off either end
+        reads the slope's bottom or top)."""
+        rect = self.rect
+        if self.rises_right:
+            run = min(max(box.right, rect.left), rect.right) - rect.left
+        else:
+            run = rect.right - max(min(box.left, rect.right), rect.left)
+        return rect.bottom - run * rect.height // rect.width
+
+
+class SpatialHash:
+    """A uniform grid over a fixed set of static rects, built once.
+
+    Each cell lists the indices of every rect overlapping it, so a query
+    only looks at the handful of cells a box covers instead of every rect
+    in the room. Results come back in the rects' original order --
+    resolution pushes the box out of solids one at a time, so visiting
+    them in a different order than the plain-list path could land it in
+    a different spot.
+    """
+
+    def __init__(self, rects: Sequence[pygame.Rect], cell_size: int = SPATIAL_HASH_CELL_SIZE):
+        self.rects = list(rects)
+        self.cell_size = cell_size
+        # Few enough rects to just scan them all (see LINEAR_SCAN_MAX_SOLIDS):
+        # the rects themselves, and no grid is built. Else None.
+        self.linear_rects = self.rects if len(self.rects) <= LINEAR_SCAN_MAX_SOLIDS else None
+        self._cells: dict[tuple[int, int], list[int]] | None = None
+        if self.linear_rects is None:
+            self._cells = {}
+            for index, rect in enumerate(self.rects):
+                for cell in self._cells_covering(rect):
+                    self._cells.setdefault(cell, []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def _cells_covering(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        size = self.cell_size
+        # right/bottom are exclusive, so a rect ending exactly on a cell
+        # boundary doesn't spill into the next cell.
+        col_range = range(rect.left // size, (rect.right - 1) // size + 1)
+        row_range = range(rect.top // size, (rect.bottom - 1) // size + 1)
+        return [(col, row) for col in col_range for row in row_range]
+
+    def query_indices(self, rect: pygame.Rect) -> list[int]:
+        """query(), as indices into `rects` -- for callers that keep
+        something alongside each rect (CollisionWorld's slopes)."""
+        cells = self._cells
+        if cells is None:
+            return rect.collidelistall(self.rects)
+        size = self.cell_size
+        found: set[int] = set()
+        for col in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                found.update(cells.get((col, row), ()))
+        return sorted(found)
+
+    def query(self, rect: pygame.Rect) -> list[pygame.Rect]:
+        """Every stored rect that might overlap `rect` (a superset, never
+        a miss), in insertion order."""
+        rects = self.rects
+        cells = self._cells
+        if cells is None:
+            return [rects[i] for i in rect.collidelistall(rects)]
+        size = self.cell_size
+        left, top = rect.left // size, rect.top // size
+        right, bottom = (rect.right - 1) // size, (rect.bottom - 1) // size
+        if left == right and top == bottom:
+            return [rects[i] for i in cells.get((left, top), ())]
+
+        found: set[int] = set()
+        for col in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                found.update(cells.get((col, row), ()))
+        return [rects[i] for i in sorted(found)]
+
+
+class CollisionWorld:
+    """A room's whole collision geometry, each kind indexed: fully solid
+    rects, one-way platforms and slopes."""
+
+    def __init__(
+        self,
+        solids: Sequence[pygame.Rect],
+        one_way: Sequence[pygame.Rect] = (),
+        slopes: Sequence[Slope] = (),
+    ):
+        self.solids = SpatialHash(solids)
+        self.one_way = SpatialHash(one_way)
+        self.slopes = list(slopes)
+        self._slope_index = SpatialHash([slope.rect for slope in self.slopes])
+
+    def slopes_near(self, rect: pygame.Rect) -> list[Slope]:
+        return [self.slopes[i] for i in self._slope_index.query_indices(rect)]
+
+
+# What move_and_collide (and every actor's update()) accepts as "the solids".
+Solids = Sequence[pygame.Rect] | SpatialHash | CollisionWorld
+
+
+def _push_out_horizontal(
+    rect: pygame.Rect, dx: float, solids: Sequence[pygame.Rect], result: CollisionResult
+) -> bool:
+    """Push `rect` (in place) out of each solid it overlaps, in order.
+
+    pygame's collidelist() finds the next overlapping solid in C, so the
+    solids in between -- nearly all of them, most steps -- cost no Python
+    at all. After each push the search resumes past that solid, against
+    the moved box, exactly as a loop testing them one by one would."""
+    collided = False
+    index = rect.collidelist(solids)
+    while index != -1:
+        solid = solids[index]
+        if dx > 0:
+            rect.right = solid.left
+            result.touched_right = True
+        elif dx < 0:
+            rect.left = solid.right
+            result.touched_left = True
+        collided = True
+        solids = solids[index + 1 :]
+        index = rect.collidelist(solids)
+    return collided
+
+
+def _push_out_vertical(
+    rect: pygame.Rect, dy: float, solids: Sequence[pygame.Rect], result: CollisionResult
+) -> bool:
+    collided = False
+    index = rect.collidelist(solids)
+    while index != -1:
+        solid = solids[index]
+        if dy > 0:
+            rect.bottom = solid.top
+            result.touched_bottom = True
+        elif dy < 0:
+            rect.top = solid.bottom
+            result.touched_top = True
+        collided = True
+        solids = solids[index + 1 :]
+        index = rect.collidelist(solids)
+    return collided
+
+
+def _sweep_horizontal(
+    rect: pygame.Rect, start: pygame.Rect, solids: Sequence[pygame.Rect], result: CollisionResult
+) -> bool:
+    """Pull `rect` (in place) back to the first solid face the box would
+    cross moving across from `start`. Returns whether there was one."""
+    if rect.x > start.x:
+        faces = [
+            solid.left
+            for solid in solids
+            if start.right <= solid.left < rect.right and solid.top < rect.bottom and solid.bottom > rect.top
+        ]
+        if faces:
+            rect.right = min(faces)
+            result.touched_right = True
+            return True
+    elif rect.x < start.x:
+        faces = [
+            solid.right
+            for solid in solids
+            if rect.left < solid.right <= start.left and solid.top < rect.bottom and solid.bottom > rect.top
+        ]
+        if faces:
+            rect.left = max(faces)
+            result.touched_left = True
+            return True
+    return False
+
+
+def _sweep_vertical(
+    rect: pygame.Rect, start: pygame.Rect, solids: Sequence[pygame.Rect], result: CollisionResult
+) -> bool:
+    if rect.y > start.y:
+        faces = [
+            solid.top
+            for solid in solids
+            if start.bottom <= solid.top < rect.bottom and solid.left < rect.right and solid.right > rect.left
+        ]
+        if faces:
+            rect.bottom = min(faces)
+            result.touched_bottom = True
+            return True
+    elif rect.y < start.y:
+        faces = [
+            solid.bottom
+            for solid in solids
+            if rect.top < solid.bottom <= start.top and solid.left < rect.right and solid.right > rect.left
+        ]
+        if faces:
+            rect.top = max(faces)
+            result.touched_top = True
+            return True
+    return False
+
+
+_Sweep = Callable[[pygame.Rect, pygame.Rect, Sequence[pygame.Rect], CollisionResult], bool]
+
+
+def _sweep_axis(
+    sweep: _Sweep, rect: pygame.Rect, start: pygame.Rect, solids: Solids, result: CollisionResult
+) -> bool:
+    """Sweep `rect` back from its landing spot when the step was long
+    enough to skip a solid -- further than the box's own size, since any
+    solid it could have jumped has to fit between where its leading edge
+    started and where its trailing edge ended up."""
+    if abs(rect.x - start.x) <= rect.width and abs(rect.y - start.y) <= rect.height:
+        return False
+    if isinstance(solids, SpatialHash):
+        solids = solids.query(rect.union(start))
+    return sweep(rect, start, solids, result)
+
+
+def _land_on_one_way(
+    rect: pygame.Rect, start: pygame.Rect, platforms: SpatialHash, result: CollisionResult
+) -> bool:
+    """Stop a box moving down on the first one-way platform top it crossed
+    -- only ones its bottom started at or above, so it can jump up through
+    them. A sweep by nature, so a long step can't skip one either."""
+    if rect.bottom <= start.bottom or not platforms.rects:
+        return False
+    tops = [
+        platform.top
+        for platform in platforms.query(rect.union(start))
+        if start.bottom <= platform.top < rect.bottom
+        and platform.left < rect.right
+        and platform.right > rect.left
+    ]
+    if not tops:
+        return False
+    rect.bottom = min(tops)
+    result.touched_bottom = True
+    return True
+
+
+def _stand_on_slopes(
+    rect: pygame.Rect, origin: pygame.Rect, dy: float, world: CollisionWorld, result: CollisionResult
+) -> bool:
+    """Put `rect` (in place) on the highest slope surface under it, if it
+    began the step (at `origin`) on or above that surface: lifted when it
+    has sunk in (walking uphill, landing), or pulled down onto it when it
+    was standing on it and only walked off the surface's line (downhill)
+    -- as far as a step that long can drop, and not while moving up."""
+    walked = abs(rect.x - origin.x)
+    area = rect.union(origin)
+    area.height += walked + 2  # reaches the surface a downhill step left behind
+    best = None
+    for slope in world.slopes_near(area):
+        if slope.rect.left >= rect.right or slope.rect.right <= rect.left:
+            continue
+        before = slope.surface_y(origin)
+        if origin.bottom > before + 1:
+            continue  # started below the surface: slopes don't block from underneath
+        surface = slope.surface_y(rect)
+        standing = abs(origin.bottom - before) <= 1
+        drop = walked * slope.rect.height // slope.rect.width + 1
+        if rect.bottom > surface or (standing and dy >= 0 and surface - rect.bottom <= drop):
+            best = surface if best is None else min(best, surface)
+    if best is None:
+        return False
+    rect.bottom = best
+    result.touched_bottom = True
+    return True
+
+
+_PushOut = Callable[[pygame.Rect, float, Sequence[pygame.Rect], CollisionResult], bool]
+
+
+def _resolve_axis(
+    push_out: _PushOut,
+    rect: pygame.Rect,
+    start: pygame.Rect,
+    delta: float,
+    solids: Solids,
+    result: CollisionResult,
+) -> bool:
+    """Push `rect` (in place) out of `solids` along one axis, narrowed by
+    the index when there is one. Returns whether it overlapped anything.
+
+    Pushing out of a solid normally only moves the box back toward where
+    it started, so the box swept from `start` to `rect` bounds every solid
+    the step can touch. The one exception is a box that starts the step
+    already embedded in a solid, which can get shoved clear past that
+    swept area -- then the narrowed pass is thrown away and redone against
+    every solid, so the index never changes the answer.
+    """
+    if not isinstance(solids, SpatialHash):
+        return push_out(rect, delta, solids, result)
+    if solids.linear_rects is not None:
+        return push_out(rect, delta, solids.linear_rects, result)
+
+    area = rect.union(start)
+    original_topleft = rect.topleft
+    flags_before = (result.touched_left, result.touched_right, result.touched_top, result.touched_bottom)
+    collided = push_out(rect, delta, solids.query(area), result)
+    if area.contains(rect):
+        return collided
+
+    rect.topleft = original_topleft
+    result.touched_left, result.touched_right, result.touched_top, result.touched_bottom = flags_before
+    return push_out(rect, delta, solids.rects, result)
+
+
 def move_and_collide(
     x: float,
     y: float,
@@ -27,7 +389,7 @@ def move_and_collide(
     height: int,
     dx: float,
     dy: float,
-    solids: list[pygame.Rect],
+    solids: Solids,
 ) -> tuple[float, float, CollisionResult]:
     """Move a `width`x`height` box from (x, y) by (dx, dy), resolving overlaps.
 
@@ -35,29 +397,29 @@ def move_and_collide(
     which callers use for things like "am I grounded" or "did I hit a wall".
     """
     result = CollisionResult()
+    world = None
+    if isinstance(solids, CollisionWorld):
+        world, solids = solids, solids.solids
 
+    start = origin = pygame.Rect(round(x), round(y), width, height)
     x += dx
-    rect = pygame.Rect(round(x), round(y), width, height)
-    for solid in solids:
-        if rect.colliderect(solid):
-            if dx > 0:
-                rect.right = solid.left
-                result.touched_right = True
-            elif dx < 0:
-                rect.left = solid.right
-                result.touched_left = True
-            x = rect.x
+    rect = start.copy()
+    rect.x = round(x)
+    swept = abs(dx) > width - 1 and _sweep_axis(_sweep_horizontal, rect, start, solids, result)
+    if _resolve_axis(_push_out_horizontal, rect, start, dx, solids, result) or swept:
+        x = rect.x
 
+    start = rect.copy()
     y += dy
-    rect = pygame.Rect(round(x), round(y), width, height)
-    for solid in solids:
-        if rect.colliderect(solid):
-            if dy > 0:
-                rect.bottom = solid.top
-                result.touched_bottom = True
-            elif dy < 0:
-                rect.top = solid.bottom
-                result.touched_top = True
+    rect.y = round(y)
+    swept = abs(dy) > height - 1 and _sweep_axis(_sweep_vertical, rect, start, solids, result)
+    if _resolve_axis(_push_out_vertical, rect, start, dy, solids, result) or swept:
+        y = rect.y
+
+    if world is not None:
+        if _land_on_one_way(rect, start, world.one_way, result):
+            y = rect.y
+        if world.slopes and _stand_on_slopes(rect, origin, dy, world, result):
             y = rect.y
 
     return x, y, result
@@ -19,8 +19,8 @@ import pygame
 import audio
 import settings
 from input import PlayerInput
-from physics import move_and_collide
-from sprite_utils import SpriteSheet
+from physics import Solids, move_and_collide
+from sprite_utils import SpriteSheet, faded_frame, tinted_frame
 
 
 class PlayerState(Enum):
@@ -38,6 +38,33 @@ _LOCKED_STATES = (PlayerState.ABSORBING, PlayerState.DODGE, PlayerState.STUMBLE,
 
 
 class Player:
+    __slots__ = (
+        "sprite",
+        "width",
+        "height",
+        "x",
+        "y",
+        "prev_x",
+        "prev_y",
+        "_rect",
+        "_rect_x",
+        "_rect_y",
+        "vx",
+        "vy",
+        "facing",
+        "on_ground",
+        "coyote_timer",
+        "jump_buffer_timer",
+        "dodge_cooldown_timer",
+        "state",
+        "absorb_timer",
+        "dodge_timer",
+        "stumble_timer",
+        "hit_timer",
+        "_run_anim_timer",
+        "_run_frame_is_a",
+    )
+
     def __init__(self, sprite: SpriteSheet, spawn_x: float, spawn_y: float):
         self.sprite = sprite
         # Collision size is fixed (settings.PLAYER_COLLISION_*), independent
@@ -48,6 +75,13 @@ class Player:
         # spawn position is her feet; store the top-left corner for physics.
         self.x = float(spawn_x - self.width / 2)
         self.y = float(spawn_y - self.height)
+        # Position as of the previous simulation step, for draw() to blend
+        # from (see settings.FIXED_TIMESTEP).
+        self.prev_x = self.x
+        self.prev_y = self.y
+        # One Rect for the actor's whole life -- see `rect`.
+        self._rect = pygame.Rect(round(self.x), round(self.y), self.width, self.height)
+        self._rect_x, self._rect_y = self.x, self.y
 
         self.vx = 0.0
         self.vy = 0.0
@@ -69,7 +103,13 @@ class Player:
 
     @property
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(round(self.x), round(self.y), self.width, self.height)
+        """Her collision box in whole pixels. One Rect is kept, moved in
+        place only when her position has changed since the last read, and
+        each read gets a copy of it -- the caller's to keep or modify."""
+        if self.x != self._rect_x or self.y != self._rect_y:
+            self._rect_x, self._rect_y = self.x, self.y
+            self._rect.x, self._rect.y = round(self.x), round(self.y)
+        return self._rect.copy()
 
     @property
     def is_absorbing(self) -> bool:
@@ -114,7 +154,16 @@ class Player:
         self.vx = settings.HIT_KNOCKBACK_SPEED * direction
         audio.play_sfx("hit")
 
-    def update(self, dt: float, input_state: PlayerInput, solids: list[pygame.Rect]) -> None:
+    def render_position(self, alpha: float) -> tuple[float, float]:
+        """Her top-left, `alpha` (0..1) of the way from the previous step's
+        position to the current one."""
+        return (
+            self.prev_x + (self.x - self.prev_x) * alpha,
+            self.prev_y + (self.y - self.prev_y) * alpha,
+        )
+
+    def update(self, dt: float, input_state: PlayerInput, solids: Solids) -> None:
+        self.prev_x, self.prev_y = self.x, self.y
         self.dodge_cooldown_timer = max(0.0, self.dodge_cooldown_timer - dt)
 
         if self.state is PlayerState.ABSORBING:
@@ -222,7 +271,7 @@ class Player:
         else:
             self.state = PlayerState.IDLE
 
-    def _update_absorbing(self, dt: float, solids: list[pygame.Rect]) -> None:
+    def _update_absorbing(self, dt: float, solids: Solids) -> None:
         self.absorb_timer -= dt
 
         # Gravity keeps applying so she settles naturally rather than
@@ -239,7 +288,7 @@ class Player:
         if self.absorb_timer <= 0:
             self.state = PlayerState.IDLE
 
-    def _update_dodge(self, dt: float, solids: list[pygame.Rect]) -> None:
+    def _update_dodge(self, dt: float, solids: Solids) -> None:
         self.dodge_timer -= dt
 
         # Gravity is suspended for a clean flat burst rather than an arc.
@@ -255,7 +304,7 @@ class Player:
             self.dodge_cooldown_timer = settings.DODGE_COOLDOWN
             self.state = PlayerState.IDLE
 
-    def _update_stumble(self, dt: float, solids: list[pygame.Rect]) -> None:
+    def _update_stumble(self, dt: float, solids: Solids) -> None:
         self.stumble_timer -= dt
 
         # Same shape as _update_absorbing: gravity continues, horizontal
@@ -272,7 +321,7 @@ class Player:
         if self.stumble_timer <= 0:
             self.state = PlayerState.IDLE
 
-    def _update_hit(self, dt: float, solids: list[pygame.Rect]) -> None:
+    def _update_hit(self, dt: float, solids: Solids) -> None:
         self.hit_timer -= dt
 
         self.vy = min(self.vy + settings.GRAVITY_FALL * dt, settings.MAX_FALL_SPEED)
@@ -294,16 +343,6 @@ class Player:
         if self.hit_timer <= 0:
             self.state = PlayerState.IDLE
 
-    @staticmethod
-    def _tinted(frame: pygame.Surface, color: tuple[int, int, int], alpha: float) -> pygame.Surface:
-        """A copy of `frame` with a flat color additively flashed over it,
-        fading as `alpha` drops -- used for every brief reaction beat below."""
-        frame = frame.copy()
-        flash = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
-        flash.fill((*color, max(0, round(alpha))))
-        frame.blit(flash, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-        return frame
-
     def _pose_frame_name(self) -> str:
         """Which sprite-sheet frame matches her current motion. The locked
         reaction states (absorbing/dodge/stumble/hit) all read from "idle"
@@ -318,29 +357,28 @@ class Player:
             return "run_a" if self._run_frame_is_a else "run_b"
         return "idle"
 
-    def draw(self, surface: pygame.Surface, camera) -> None:
-        frame = self.sprite.get(self._pose_frame_name())
+    def draw(self, surface: pygame.Surface, camera, alpha: float = 1.0) -> None:
+        frame = self.sprite.get(self._pose_frame_name(), self.facing)
         if self.is_absorbing:
             # A brief fading white flash so the beat reads as a deliberate
             # event rather than a silent, instant deletion.
-            frame = self._tinted(frame, (255, 255, 255), 160 * (self.absorb_timer / settings.ABSORB_DURATION))
+            fade = self.absorb_timer / settings.ABSORB_DURATION
+            frame = tinted_frame(frame, (255, 255, 255), 160 * fade)
         elif self.state is PlayerState.STUMBLE:
             # Dim/washed-out -- reaching for a tool she doesn't have.
-            frame = self._tinted(frame, (150, 150, 150), 130 * (self.stumble_timer / settings.STUMBLE_DURATION))
+            fade = self.stumble_timer / settings.STUMBLE_DURATION
+            frame = tinted_frame(frame, (150, 150, 150), 130 * fade)
         elif self.state is PlayerState.HIT:
-            frame = self._tinted(frame, (220, 60, 60), 170 * (self.hit_timer / settings.HIT_DURATION))
+            frame = tinted_frame(frame, (220, 60, 60), 170 * (self.hit_timer / settings.HIT_DURATION))
         elif self.state is PlayerState.DODGE:
             # A translucent "ghost" reads as briefly intangible.
-            frame = frame.copy()
-            frame.set_alpha(140)
-
-        if self.facing == -1:
-            frame = pygame.transform.flip(frame, True, False)
+            frame = faded_frame(frame, 140)
 
         # Center the sprite horizontally over the (fixed-size) collision
         # box and align their bottoms (feet), since the sprite's own pixel
         # size no longer has to match the collision box.
-        draw_x = self.x - (frame.get_width() - self.width) / 2
-        draw_y = self.y - (frame.get_height() - self.height)
+        x, y = self.render_position(alpha)
+        draw_x = x - (frame.get_width() - self.width) / 2
+        draw_y = y - (frame.get_height() - self.height)
         screen_x, screen_y = camera.apply(draw_x, draw_y)
         surface.blit(frame, (round(screen_x), round(screen_y)))
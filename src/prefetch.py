@@ -0,0 +1,213 @@
+"""Warms the rooms the player is heading towards, within a memory budget.
+
+`next_room` links make the rooms a graph -- WAKING_HOLLOW -> FOREST_FLOOR
+-> CLEARING -> DEEPER_FOREST -- and a room's reveal_zone leads out of it
+to the Master reveal (CUTSCENE_MASTER, a node with no links of its own).
+GameplayScene calls enter_room() when it's built and update() every step,
+and between them this module decides which nodes' assets -- background,
+music track, sprites -- are resident:
+  - the current room and the checkpoint room are pinned: always warm, so
+    neither a respawn nor the room itself waits on a load;
+  - once the player is within ROOM_PREFETCH_DISTANCE of an exit or reveal
+    zone, the nodes past it are warmed, nearest in the graph first and at
+    most ROOM_PREFETCH_DEPTH links from the current room, for as long as
+    ROOM_PREFETCH_BUDGET_MB allows -- evicting warm nodes further out in
+    the graph to make room;
+  - entering a room evicts every node no longer within ROOM_PREFETCH_DEPTH
+    links of it, which includes the rooms behind her (links only go
+    forward) other than the checkpoint.
+
+The loading itself is asset_loader's (room backgrounds decoded on its
+worker thread, then baked with their geometry on the main thread -- see
+level.BakedLayer -- and music read into memory on the worker too) and
+sprite_utils' refcounted preloads; room dicts come from room_store, whose
+retain() this drives. Only the graph's shape -- which node links to
+which -- is kept for the session.
+
+Module-level state, same as asset_loader: there's one player and one map.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from functools import partial
+from pathlib import Path
+
+import pygame
+
+import asset_loader
+import audio
+import room_store
+import settings
+from cutscene_master import BACKGROUND_PATH as MASTER_BACKGROUND_PATH
+from level import background_path, bake_room, baked_size
+from sprite_utils import preload_sprites, release_sprites
+
+CUTSCENE_MASTER = "cutscene_master"  # reveal_zone's node (room keys are upper-case)
+
+# Every surface is convert()ed to the display format -- 32 bits on anything
+# this runs on -- so an image's size is known before it's decoded.
+_BYTES_PER_PIXEL = 4
+
+# An asset is ("image", path), ("baked", room key), ("music", path) or
+# ("sprite", name).
+Asset = tuple[str, Path | str]
+
+_links: dict[str, list[str]] = {}
+_graph_distance: dict[str, int] = {}
+_pinned: set[str] = set()
+_room_key: str | None = None
+_exits_warmed: set[str] = set()
+_warm: dict[str, dict[Asset, int]] = {}  # node -> its assets, with estimated bytes
+_resident: dict[Asset, int] = {}
+
+
+def _node_links(node: str) -> list[str]:
+    """The nodes `node` can hand off to, read from its room on first use."""
+    links = _links.get(node)
+    if links is None:
+        links = []
+        if node != CUTSCENE_MASTER:
+            room_data = room_store.load_room(node)
+            if "exit_zone" in room_data and "next_room" in room_data:
+                links.append(room_data["next_room"])
+            if "reveal_zone" in room_data:
+                links.append(CUTSCENE_MASTER)
+        _links[node] = links
+    return links
+
+
+def _node_assets(node: str) -> dict[Asset, int]:
+    """What warming `node` makes resident, each with its size in bytes.
+
+    A room's sprites are all GAMEPLAY_SPRITES, which Game keeps resident
+    for the whole session, so a room only brings its music and its
+    background, baked with its geometry -- the only copy of it kept.
+    Sprites count as 0 -- a few KB each, next to megabytes of background.
+    """
+    assets: dict[Asset, int] = {}
+    if node == CUTSCENE_MASTER:
+        size = settings.WINDOW_WIDTH * settings.WINDOW_HEIGHT * _BYTES_PER_PIXEL
+        assets[("image", MASTER_BACKGROUND_PATH)] = size
+        assets[("sprite", "master")] = 0
+        track = "warmth"
+    else:
+        room_data = room_store.load_room(node)
+        if "background" in room_data:
+            width, height = baked_size(room_data)
+            assets[("baked", node)] = width * height * _BYTES_PER_PIXEL
+        track = room_data.get("music", "exploration")
+    if audio.is_enabled():
+        path = audio.TRACK_PATHS[track]
+        assets[("music", path)] = path.stat().st_size
+    return assets
+
+
+def _load(asset: Asset) -> None:
+    kind, name = asset
+    if kind == "image":
+        asset_loader.prefetch_image(name)
+    elif kind == "baked":
+        room_data = room_store.load_room(name)
+        asset_loader.prefetch_built(
+            name, background_path(room_data["background"]), partial(bake_room, room_data)
+        )
+    elif kind == "music":
+        asset_loader.prefetch_bytes(name)
+    else:
+        # Synchronous, unlike the others -- but a sprite decodes in well
+        # under a millisecond, and only the reveal brings one.
+        preload_sprites([name])
+
+
+def _unload(asset: Asset) -> None:
+    kind, name = asset
+    if kind == "sprite":
+        release_sprites([name])
+    else:
+        asset_loader.release(name)
+
+
+def _evict(node: str) -> None:
+    assets = _warm.pop(node)
+    still_needed = {asset for other in _warm.values() for asset in other}
+    for asset in assets:
+        if asset not in still_needed:
+            del _resident[asset]
+            _unload(asset)
+
+
+def _warm_node(node: str) -> bool:
+    """Start `node`'s assets loading. False if it doesn't fit the budget,
+    even with every warm node further out in the graph evicted."""
+    if node in _warm:
+        return True
+    assets = _node_assets(node)
+    if node not in _pinned:
+        budget = settings.ROOM_PREFETCH_BUDGET_MB * 1024 * 1024
+        distance = _graph_distance[node]
+        further_out = sorted(
+            (other for other in _warm if other not in _pinned and _graph_distance.get(other, 0) > distance),
+            key=_graph_distance.get,
+        )
+        while sum(_resident.values()) + sum(
+            size for asset, size in assets.items() if asset not in _resident
+        ) > budget:
+            if not further_out:
+                return False
+            _evict(further_out.pop())
+    _warm[node] = assets
+    for asset, size in assets.items():
+        if asset not in _resident:
+            _resident[asset] = size
+            _load(asset)
+    return True
+
+
+def enter_room(room_key: str, checkpoint_key: str) -> None:
+    """Re-centre on `room_key`: map the graph out to ROOM_PREFETCH_DEPTH,
+    evict whatever fell out of it, and pin this and the checkpoint room."""
+    global _room_key, _pinned
+    _room_key = room_key
+    _exits_warmed.clear()
+    _graph_distance.clear()
+    _graph_distance[room_key] = 0
+    queue = deque([room_key])
+    while queue:
+        node = queue.popleft()
+        if _graph_distance[node] == settings.ROOM_PREFETCH_DEPTH:
+            continue
+        for linked in _node_links(node):
+            if linked not in _graph_distance:
+                _graph_distance[linked] = _graph_distance[node] + 1
+                queue.append(linked)
+
+    _pinned = {room_key, checkpoint_key}
+    room_store.retain((set(_graph_distance) | _pinned) - {CUTSCENE_MASTER})
+    for node in list(_warm):
+        if node not in _graph_distance and node not in _pinned:
+            _evict(node)
+    for node in _pinned:
+        _warm_node(node)
+
+
+def update(player_rect: pygame.Rect) -> None:
+    """Warm what lies past each exit the player is near. Call every step."""
+    room_data = room_store.load_room(_room_key)
+    exits = (("exit_zone", room_data.get("next_room")), ("reveal_zone", CUTSCENE_MASTER))
+    for zone_key, node in exits:
+        if node is None or zone_key not in room_data or node in _exits_warmed:
+            continue
+        zone = pygame.Rect(*room_data[zone_key])
+        if abs(player_rect.centerx - zone.centerx) > settings.ROOM_PREFETCH_DISTANCE:
+            continue
+        _exits_warmed.add(node)
+        # Everything mapped past this exit, nearest in the graph first.
+        order = [node]
+        for ahead in order:
+            order.extend(
+                linked for linked in _links.get(ahead, ()) if linked in _graph_distance and linked not in order
+            )
+        for ahead in order:
+            if not _warm_node(ahead):
+                break
@@ -0,0 +1,100 @@
+"""The F3 profiler overlay: where each frame's time budget goes, on
+whatever machine the game is running on.
+
+Game times each phase of its loop (events, update, audio, assets, draw,
+present) as profiling zones, and scenes add their own inside update()
+(GameplayScene's "player", "hazards", ...); this draws the last
+PROFILER_HISTORY_FRAMES frames of all of it -- a rolling graph of frame
+time against the frame budget, and p50/p95/p99 per zone. Game presents
+the whole frame every frame while it's up, whatever dirty_rects() says.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pygame
+
+import profiling
+import settings
+from text_render import get_font
+
+# The loop's own phases, in the order they run (see Game.run); any other
+# zone is a scene's, inside "update" or "draw".
+LOOP_ZONES = ("events", "update", "audio", "assets", "draw", "present")
+# One frame at settings.FPS -- what the graph's budget line marks. An
+# uncapped game (FPS = 0) is still measured against 60fps.
+FRAME_BUDGET = 1 / (settings.FPS or 60)
+
+COLOR_PANEL = (8, 8, 12, 200)
+COLOR_TEXT = (220, 220, 210)
+COLOR_DIM_TEXT = (150, 150, 145)
+COLOR_GRAPH = (120, 200, 120)
+COLOR_GRAPH_OVER_BUDGET = (230, 110, 80)
+COLOR_BUDGET_LINE = (200, 180, 90)
+
+PANEL_WIDTH = 300
+PANEL_MARGIN = 10
+PADDING = 8
+GRAPH_HEIGHT = 60
+ROW_HEIGHT = 15
+# Right edges of the p50 / p95 / p99 columns, from the panel's left.
+COLUMN_RIGHTS = (170, 225, 280)
+
+
+class ProfilerOverlay:
+    def __init__(self):
+        self._font = get_font(18)
+        self._readout: pygame.Surface | None = None
+        self._readout_time = 0.0
+        self._shade: pygame.Surface | None = None
+
+    def _build_readout(self) -> pygame.Surface:
+        """The percentile table. Rendered straight from the font, not
+        through text_render's cache: the numbers change every refresh, so
+        caching them would only push out strings that don't."""
+        rows = [("ms", ("p50", "p95", "p99"), COLOR_DIM_TEXT)]
+        scene_zones = [name for name in profiling.zone_names() if name not in LOOP_ZONES]
+        for name in ("frame", *LOOP_ZONES, *scene_zones):
+            label = f"  {name}" if name in scene_zones else name
+            values = tuple(f"{seconds * 1000:.2f}" for seconds in profiling.percentiles(name))
+            rows.append((label, values, COLOR_TEXT))
+
+        readout = pygame.Surface((PANEL_WIDTH - 2 * PADDING, ROW_HEIGHT * len(rows)), pygame.SRCALPHA)
+        for index, (label, values, color) in enumerate(rows):
+            y = index * ROW_HEIGHT
+            readout.blit(self._font.render(label, True, color), (0, y))
+            for value, right in zip(values, COLUMN_RIGHTS):
+                text = self._font.render(value, True, color)
+                readout.blit(text, text.get_rect(topright=(right - PADDING, y)))
+        return readout
+
+    def draw(self, surface: pygame.Surface) -> None:
+        now = time.perf_counter()
+        if self._readout is None or now - self._readout_time >= settings.PROFILER_TEXT_INTERVAL:
+            self._readout = self._build_readout()
+            self._readout_time = now
+
+        height = PADDING * 3 + GRAPH_HEIGHT + self._readout.get_height()
+        panel = pygame.Rect(surface.get_width() - PANEL_WIDTH - PANEL_MARGIN, PANEL_MARGIN, PANEL_WIDTH, height)
+        if self._shade is None or self._shade.get_size() != panel.size:
+            self._shade = pygame.Surface(panel.size, pygame.SRCALPHA)
+            self._shade.fill(COLOR_PANEL)
+        surface.blit(self._shade, panel)
+
+        # Frame times as bars, newest on the right; the graph's top is
+        # twice the budget, so the budget line sits halfway up.
+        graph = pygame.Rect(panel.x + PADDING, panel.y + PADDING, PANEL_WIDTH - 2 * PADDING, GRAPH_HEIGHT)
+        scale = graph.height / (2 * FRAME_BUDGET)
+        frames = profiling.history("frame")[-graph.width :]
+        left = graph.right - len(frames)
+        for offset, seconds in enumerate(frames):
+            bar = min(graph.height, round(seconds * scale))
+            if bar:
+                color = COLOR_GRAPH_OVER_BUDGET if seconds > FRAME_BUDGET else COLOR_GRAPH
+                x = left + offset
+                pygame.draw.line(surface, color, (x, graph.bottom - 1), (x, graph.bottom - bar))
+        budget_y = graph.bottom - round(FRAME_BUDGET * scale)
+        pygame.draw.line(surface, COLOR_BUDGET_LINE, (graph.left, budget_y), (graph.right - 1, budget_y))
+
+        surface.blit(self._readout, (graph.x, graph.bottom + PADDING))
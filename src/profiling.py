@@ -0,0 +1,134 @@
+"""Named timing zones: where update()/draw() time actually goes.
+
+Module-level state rather than an object threaded through every scene,
+same reasoning as audio.py -- there's only ever one game loop to measure.
+Game code marks a stretch of work with `with profiling.zone("hazards"):`;
+while profiling is off (the default) that hands back one shared do-nothing
+context manager, so leaving the zones in costs next to nothing. Tools like
+tools/simulate_headless.py switch it on and read the accumulated totals.
+
+The game loop also closes off each frame with end_frame(), which keeps
+the last PROFILER_HISTORY_FRAMES frames' time per zone -- what the F3
+overlay (src/profiler_overlay.py) graphs and takes percentiles of.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+
+from settings import PROFILER_HISTORY_FRAMES
+
+_enabled = False
+_totals: dict[str, float] = {}
+_counts: dict[str, int] = {}
+# This frame's time per zone so far, and the finished frames before it.
+_frame: dict[str, float] = {}
+_history: dict[str, deque[float]] = {}
+
+
+class _Zone:
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        elapsed = time.perf_counter() - self._start
+        _totals[self.name] = _totals.get(self.name, 0.0) + elapsed
+        _counts[self.name] = _counts.get(self.name, 0) + 1
+        _frame[self.name] = _frame.get(self.name, 0.0) + elapsed
+
+
+class _NullZone:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_ZONE = _NullZone()
+# One reusable timer per name -- zones with the same name never nest.
+_zones: dict[str, _Zone] = {}
+
+
+def zone(name: str) -> _Zone | _NullZone:
+    """A context manager that adds its wall-clock time to `name`'s total."""
+    if not _enabled:
+        return _NULL_ZONE
+    timer = _zones.get(name)
+    if timer is None:
+        timer = _zones[name] = _Zone(name)
+    return timer
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    _totals.clear()
+    _counts.clear()
+    _frame.clear()
+    _history.clear()
+
+
+def totals() -> dict[str, float]:
+    """Seconds spent in each zone since the last reset(), by name."""
+    return dict(_totals)
+
+
+def counts() -> dict[str, int]:
+    """How many times each zone was entered since the last reset()."""
+    return dict(_counts)
+
+
+def end_frame(frame_seconds: float) -> None:
+    """Close off one frame: `frame_seconds` (the whole frame's work) goes
+    into the "frame" history, and every zone's time this frame into its
+    own -- 0 for a zone that didn't run."""
+    if not _enabled:
+        return
+    _frame["frame"] = frame_seconds
+    for name in _frame:
+        if name not in _history:
+            _history[name] = deque(maxlen=PROFILER_HISTORY_FRAMES)
+    for name, samples in _history.items():
+        samples.append(_frame.get(name, 0.0))
+    _frame.clear()
+
+
+def history(name: str) -> list[float]:
+    """Seconds `name` took in each recent frame, oldest first."""
+    return list(_history.get(name, ()))
+
+
+def percentiles(name: str, ranks: tuple[int, ...] = (50, 95, 99)) -> tuple[float, ...]:
+    """Nearest-rank percentiles of `name`'s recent per-frame seconds, or
+    zeros before it has any."""
+    samples = sorted(_history.get(name, ()))
+    if not samples:
+        return tuple(0.0 for _ in ranks)
+    return tuple(samples[min(len(samples) - 1, len(samples) * rank // 100)] for rank in ranks)
+
+
+def zone_names() -> list[str]:
+    """Every zone with recent history, in the order each first ran."""
+    return [name for name in _history if name != "frame"]
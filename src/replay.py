@@ -0,0 +1,203 @@
+"""Input recording and frame-exact replay for GameplayScene.
+
+A gameplay run is fully determined by where it started (room, GameProgress,
+the room's RNG seed) plus the PlayerInput and dt fed to every update() --
+nothing else in a room is random or reads the clock. So that's all a
+recording holds, in a small binary file:
+
+    header   MAGIC, version, seed, the starting GameProgress, room key
+    steps    one byte per step: the six PlayerInput flags as bits. A step
+             whose dt differs from the previous one sets DT_CHANGED and is
+             followed by the new dt as a float64 -- at a fixed timestep
+             that's once per file, so a step costs one byte.
+    trailer  END_MARKER, then the last recorded scene's player position and
+             hearts, so a replay can check it really ended in the same place.
+
+`load_replay()` + `play()` feed a file back through a fresh GameplayScene
+(its `input_source`, the same hook tools/simulate_headless.py uses), with
+no window needed -- tools/replay_session.py runs whole batches of them.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+import room_store
+from game_progress import GameProgress
+from gameplay_scene import GameplayScene
+from input import PlayerInput
+
+MAGIC = b"CTJR"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHQBB?")  # magic, version, seed, max/current hearts, unlocked
+_DT = struct.Struct("<d")
+_DIGEST = struct.Struct("<ddB")  # player x, player y, current hearts
+
+_INPUT_FIELDS = tuple(field.name for field in fields(PlayerInput))
+DT_CHANGED = 0x80
+END_MARKER = 0xFF  # bit 6 is never set by a step, so this can't collide
+
+
+def _encode_input(player_input: PlayerInput) -> int:
+    bits = 0
+    for bit, name in enumerate(_INPUT_FIELDS):
+        if getattr(player_input, name):
+            bits |= 1 << bit
+    return bits
+
+
+def _decode_input(bits: int) -> PlayerInput:
+    return PlayerInput(**{name: bool(bits & (1 << bit)) for bit, name in enumerate(_INPUT_FIELDS)})
+
+
+def _pack_str(text: str) -> bytes:
+    encoded = text.encode("utf-8")
+    return bytes([len(encoded)]) + encoded
+
+
+def _digest(scene: GameplayScene) -> tuple[float, float, int]:
+    return (scene.player.x, scene.player.y, scene.progress.current_hearts)
+
+
+class InputRecorder:
+    """Streams a run to `path` as it happens -- attach it to the first
+    GameplayScene with start(); room transitions carry it along from there."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = None
+        self._last_dt: float | None = None
+        self._last_scene: GameplayScene | None = None
+
+    @property
+    def started(self) -> bool:
+        return self._file is not None
+
+    def start(self, scene: GameplayScene) -> None:
+        progress = scene.progress
+        self._file = self.path.open("wb")
+        self._file.write(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                scene.seed,
+                progress.max_hearts,
+                progress.current_hearts,
+                progress.absorption_unlocked,
+            )
+        )
+        self._file.write(_pack_str(progress.checkpoint_room_key))
+        self._file.write(_pack_str(scene.room_key))
+        scene.recorder = self
+
+    def record(self, scene: GameplayScene, dt: float, player_input: PlayerInput) -> None:
+        bits = _encode_input(player_input)
+        if dt != self._last_dt:
+            self._file.write(bytes([bits | DT_CHANGED]) + _DT.pack(dt))
+            self._last_dt = dt
+        else:
+            self._file.write(bytes([bits]))
+        self._last_scene = scene
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self._file.write(bytes([END_MARKER]))
+        if self._last_scene is not None:
+            self._file.write(_DIGEST.pack(*_digest(self._last_scene)))
+        self._file.close()
+        self._file = None
+
+
+@dataclass
+class Replay:
+    seed: int
+    progress: dict
+    room_key: str
+    steps_data: bytes
+    final_digest: tuple[float, float, int] | None
+
+    def steps(self) -> Iterator[tuple[float, PlayerInput]]:
+        data = self.steps_data
+        dt = 0.0
+        offset = 0
+        while offset < len(data):
+            bits = data[offset]
+            offset += 1
+            if bits & DT_CHANGED:
+                (dt,) = _DT.unpack_from(data, offset)
+                offset += _DT.size
+            yield dt, _decode_input(bits & ~DT_CHANGED)
+
+
+def load_replay(path: Path) -> Replay:
+    data = path.read_bytes()
+    magic, version, seed, max_hearts, current_hearts, unlocked = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version-{VERSION} replay file")
+    offset = _HEADER.size
+
+    strings = []
+    for _ in range(2):
+        length = data[offset]
+        strings.append(data[offset + 1 : offset + 1 + length].decode("utf-8"))
+        offset += 1 + length
+    checkpoint_room_key, room_key = strings
+
+    # Walked step by step rather than searched for: a dt's float64 bytes
+    # can contain END_MARKER's value too.
+    end = offset
+    while end < len(data) and data[end] != END_MARKER:
+        end += 1 + (_DT.size if data[end] & DT_CHANGED else 0)
+    final_digest = None
+    if len(data) - end - 1 >= _DIGEST.size:
+        final_digest = _DIGEST.unpack_from(data, end + 1)
+    # (No trailer at all means the game didn't shut down cleanly -- the
+    # steps up to that point still replay fine.)
+
+    progress = asdict(
+        GameProgress(
+            max_hearts=max_hearts,
+            current_hearts=current_hearts,
+            absorption_unlocked=unlocked,
+            checkpoint_room_key=checkpoint_room_key,
+        )
+    )
+    return Replay(seed, progress, room_key, data[offset:end], final_digest)
+
+
+def play(replay: Replay) -> tuple[GameplayScene, int]:
+    """Run `replay` headlessly, start to finish. Returns the scene that ran
+    the last step (the one the recording's trailer describes) and how many
+    steps were played -- fewer than recorded only if the run left gameplay
+    (e.g. the reveal cutscene) before the recording ran out."""
+    room_data = room_store.load_room(replay.room_key)
+    scene = GameplayScene(room_data, GameProgress(**replay.progress), seed=replay.seed)
+    pending: list[PlayerInput] = []
+    scene.input_source = pending.pop
+
+    played = 0
+    last_stepped = scene
+    for dt, player_input in replay.steps():
+        pending.append(player_input)
+        last_stepped = scene
+        next_scene = scene.update(dt)
+        played += 1
+        if next_scene is None:
+            continue
+        if not isinstance(next_scene, GameplayScene):
+            break
+        scene = next_scene
+    return last_stepped, played
+
+
+def matches_recording(replay: Replay, scene: GameplayScene) -> bool | None:
+    """Whether `scene` ended where the recording did; None if the file has
+    no trailer to compare against."""
+    if replay.final_digest is None:
+        return None
+    return _digest(scene) == replay.final_digest
@@ -0,0 +1,184 @@
+"""Compiled room files: the binary format, and loading rooms lazily by key.
+
+data/rooms.py is where rooms are authored, but the game never imports it:
+tools/compile_rooms.py writes each room to `assets/rooms/{KEY}.room`, and
+load_room() reads just the one asked for, the first time it's asked for.
+Startup doesn't grow with the amount of content, and retain() -- called by
+GameplayScene with the current room and the rooms it can lead to -- drops
+every other room from memory again.
+
+A .room file is a small header (MAGIC, VERSION) followed by tagged fields,
+one per key the room dict has: a 1-byte tag, then the value packed per its
+kind (see _FIELDS) -- little-endian int16s for every coordinate, with
+rect/point lists as a count plus one flat packed int16 array. That caps
+a room at MAX_COORDINATE (32767) px on either axis, far edges included;
+tools/compile_rooms.py refuses anything bigger. Decoding gives back a dict
+shaped exactly like the data/rooms.py entry ("next_room" included -- it's
+a room key in both), except that a "tilemap" room is stored already
+merged into rects (src/tilemap.py): "platforms" holds its ground rects
+then its platform rects, "ground_count" says how many of them are ground,
+and its one-way tiles join "one_way_platforms".
+"""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+from settings import PROJECT_ROOT
+from tilemap import GROUND_TILE, ONE_WAY_TILE, PLATFORM_TILE, merge_tiles, tilemap_size
+
+ROOMS_DIR = PROJECT_ROOT / "assets" / "rooms"
+
+MAGIC = b"CTJM"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sH")
+_TAG = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_POINT = struct.Struct("<2h")
+_RECT = struct.Struct("<4h")
+# The largest coordinate an int16 holds -- and so the widest/tallest a room
+# can be, since every rect's far edge has to fit too.
+MAX_COORDINATE = 32767
+
+# tag -> (room dict key, kind). Tags are part of the file format: append
+# new fields, never renumber existing ones.
+_FIELDS = {
+    1: ("key", "str"),
+    2: ("world_width", "u16"),
+    3: ("world_height", "u16"),
+    4: ("platforms", "rects"),
+    5: ("ground_count", "u16"),
+    6: ("player_spawn", "point"),
+    7: ("enemy_spawn", "point"),
+    8: ("enemy_patrol_bounds", "point"),
+    9: ("hazards", "points"),
+    10: ("attack_beast_spawn", "point"),
+    11: ("exit_zone", "rect"),
+    12: ("checkpoint_zone", "rect"),
+    13: ("reveal_zone", "rect"),
+    14: ("log_obstacle", "rect"),
+    15: ("light_shaft", "rect"),
+    16: ("warm_glow", "rect"),
+    17: ("tutorial_prompt", "str"),
+    18: ("next_room", "str"),
+    19: ("background", "str"),
+    20: ("music", "str"),
+    21: ("one_way_platforms", "rects"),
+    22: ("slopes", "slopes"),
+    23: ("enemies", "enemies"),
+}
+# Coordinates per item of each list kind.
+_ITEM_WIDTHS = {"rects": 4, "points": 2, "slopes": 5, "enemies": 4}
+_TAGS = {name: (tag, kind) for tag, (name, kind) in _FIELDS.items()}
+
+_rooms: dict[str, dict] = {}
+
+
+def _pack_value(kind: str, value) -> bytes:
+    if kind == "str":
+        encoded = value.encode("utf-8")
+        return _U16.pack(len(encoded)) + encoded
+    if kind == "u16":
+        return _U16.pack(value)
+    if kind == "point":
+        return _POINT.pack(*value)
+    if kind == "rect":
+        return _RECT.pack(*value)
+    # The list kinds: a count, then every coordinate as one flat array.
+    flat = [coordinate for item in value for coordinate in item]
+    return _U16.pack(len(value)) + struct.pack(f"<{len(flat)}h", *flat)
+
+
+def _unpack_value(kind: str, data: bytes, offset: int) -> tuple[object, int]:
+    if kind == "str":
+        (length,) = _U16.unpack_from(data, offset)
+        start = offset + _U16.size
+        return data[start : start + length].decode("utf-8"), start + length
+    if kind == "u16":
+        return _U16.unpack_from(data, offset)[0], offset + _U16.size
+    if kind == "point":
+        return _POINT.unpack_from(data, offset), offset + _POINT.size
+    if kind == "rect":
+        return _RECT.unpack_from(data, offset), offset + _RECT.size
+    width = _ITEM_WIDTHS[kind]
+    (count,) = _U16.unpack_from(data, offset)
+    offset += _U16.size
+    flat = struct.unpack_from(f"<{count * width}h", data, offset)
+    items = [flat[i : i + width] for i in range(0, len(flat), width)]
+    return items, offset + struct.calcsize(f"<{count * width}h")
+
+
+def encode_room(room_data: dict) -> bytes:
+    """One data/rooms.py room as .room file bytes. Raises ValueError for a
+    key the format doesn't know -- better than silently dropping it."""
+    room_data = dict(room_data)
+    if "tilemap" in room_data:
+        tilemap = room_data.pop("tilemap")
+        rows, tile_size = tilemap["rows"], tilemap["tile_size"]
+        ground = merge_tiles(rows, GROUND_TILE, tile_size)
+        platforms = merge_tiles(rows, PLATFORM_TILE, tile_size)
+        room_data["world_width"], room_data["world_height"] = tilemap_size(rows, tile_size)
+        room_data["platforms"] = [tuple(rect) for rect in ground + platforms]
+        room_data["ground_count"] = len(ground)
+        one_way = merge_tiles(rows, ONE_WAY_TILE, tile_size)
+        if one_way:
+            room_data["one_way_platforms"] = [
+                *room_data.get("one_way_platforms", ()),
+                *(tuple(rect) for rect in one_way),
+            ]
+
+    chunks = [_HEADER.pack(MAGIC, VERSION)]
+    for name, value in room_data.items():
+        if name not in _TAGS:
+            raise ValueError(f"room {room_data.get('key')!r}: no .room field for {name!r}")
+        tag, kind = _TAGS[name]
+        try:
+            chunks.append(_TAG.pack(tag) + _pack_value(kind, value))
+        except struct.error as exc:
+            raise ValueError(f"room {room_data.get('key')!r}: {name!r} doesn't fit the format ({exc})") from exc
+    return b"".join(chunks)
+
+
+def decode_room(data: bytes) -> dict:
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a version-{VERSION} .room file")
+    room_data = {}
+    offset = _HEADER.size
+    while offset < len(data):
+        (tag,) = _TAG.unpack_from(data, offset)
+        if tag not in _FIELDS:
+            raise ValueError(f"unknown .room field tag {tag}")
+        name, kind = _FIELDS[tag]
+        room_data[name], offset = _unpack_value(kind, data, offset + _TAG.size)
+    return room_data
+
+
+def room_path(key: str) -> Path:
+    return ROOMS_DIR / f"{key}.room"
+
+
+def load_room(key: str) -> dict:
+    """The room dict for `key`, read from its .room file on first use.
+    Raises KeyError for a room that was never compiled."""
+    room_data = _rooms.get(key)
+    if room_data is None:
+        path = room_path(key)
+        if not path.exists():
+            raise KeyError(key)
+        room_data = _rooms[key] = decode_room(path.read_bytes())
+    return room_data
+
+
+def retain(keys: set[str]) -> None:
+    """Forget every loaded room not in `keys` (each reloads on demand)."""
+    for key in list(_rooms):
+        if key not in keys:
+            del _rooms[key]
+
+
+def room_keys() -> list[str]:
+    """Every compiled room's key."""
+    return sorted(path.stem for path in ROOMS_DIR.glob("*.room"))
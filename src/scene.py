@@ -15,6 +15,10 @@ class Scene:
     # Subclasses set `self.quit_requested = True` (e.g. on Esc during
     # gameplay) to end the app; Game.run() checks this after every event.
     quit_requested = False
+    # How far (0..1) the current frame sits between the last two fixed
+    # simulation steps -- set by Game.run() before every draw(). Scenes
+    # that move things blend positions by this; the rest can ignore it.
+    render_alpha = 1.0
 
     def handle_event(self, event: pygame.event.Event) -> None:
         pass
@@ -23,5 +27,13 @@ class Scene:
         """Return a new Scene to switch to it now, or None to keep running this one."""
         return None
 
+    def dirty_rects(self) -> list[pygame.Rect] | None:
+        """Which regions of the last frame this scene drew would change if
+        draw() ran now -- asked right before every draw() (see settings.
+        DIRTY_RECT_PRESENT). None, the default, means "assume all of it";
+        an empty list means nothing changed, so the frame is skipped.
+        draw() still always redraws the whole surface when it does run."""
+        return None
+
     def draw(self, surface: pygame.Surface) -> None:
         raise NotImplementedError
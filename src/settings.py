@@ -19,9 +19,40 @@ SPRITES_DIR = PROJECT_ROOT / "assets" / "sprites"
 
 WINDOW_WIDTH = 960
 WINDOW_HEIGHT = 540
-FPS = 60
+FPS = 60  # render cap only (when FIXED_TIMESTEP is on); 0 = uncapped
 WINDOW_TITLE = "Corruption: The Journey -- Chapter 0 Demo"
 
+# --- Simulation timestep -----------------------------------------------------
+# With FIXED_TIMESTEP on, Game.run() advances every scene in constant
+# SIMULATION_HZ steps regardless of how fast frames are drawn, and draw()
+# interpolates between the last two steps -- so jump arcs (and every room's
+# jump-clearance math) come out the same on a 30 Hz laptop or a 240 Hz
+# monitor, and a run is exactly reproducible. Off falls back to feeding
+# the clamped per-frame delta straight into update().
+# 60 Hz is the rate every arc and gap in data/rooms.py was tuned at (the
+# old capped frame delta): a finer step integrates gravity differently --
+# a higher apex -- and turns a standing actor's per-step fall into a
+# fraction of a pixel, which rounds away instead of touching the floor.
+
+FIXED_TIMESTEP = True
+SIMULATION_HZ = 60
+# A frame longer than this (window dragged, debugger paused) is treated as
+# this long, so catching up never turns into a burst of hundreds of steps.
+MAX_FRAME_TIME = 0.25
+
+# --- Presentation -------------------------------------------------------------
+# Scenes that barely change between frames (menus, cutscene cards) report
+# just the regions that did via Scene.dirty_rects(), and Game.run() then
+# redraws/presents only those -- or skips the frame outright if nothing
+# changed. Off presents the whole frame every time, whatever scenes report.
+
+DIRTY_RECT_PRESENT = True
+# Fullscreen scales the 960x540 frame up by the largest factor that fits.
+# True rounds that down to a whole number (4x on a 4K display, 2x on
+# 1080p...) for perfectly even pixels, at the cost of wider black borders
+# on displays that aren't an exact multiple.
+FULLSCREEN_INTEGER_SCALE = False
+
 # --- Colors (placeholder palette, nodding to the corrupted-forest tone) ---
 
 COLOR_BACKGROUND = (30, 32, 40)
@@ -115,6 +146,22 @@ BEAST_IDLE_JITTER_PX = 3
 
 CAMERA_LERP_SPEED = 4.5  # higher = camera catches up to the player faster
 
+# --- Room streaming --------------------------------------------------------------
+# How close (px, horizontally) the player gets to a room's exit (or reveal
+# zone) before what's past it starts loading in the background -- see
+# src/prefetch.py.
+
+ROOM_PREFETCH_DISTANCE = 700
+# How many next_room links ahead of the current room get warmed once she's
+# near its exit; rooms further out than this (or behind her, other than the
+# checkpoint) are evicted.
+ROOM_PREFETCH_DEPTH = 2
+# Cap on the backgrounds (baked with their room's geometry -- see
+# level.BakedLayer) and music prefetch.py keeps resident. The current and
+# checkpoint rooms always stay; rooms further ahead are only warmed if they
+# fit, evicting ones further out first.
+ROOM_PREFETCH_BUDGET_MB = 32
+
 # --- Hearts / progress ---------------------------------------------------------
 # Real death exists from the moment this system is introduced -- running out of
 # hearts respawns her at the last checkpoint. The one deliberate exception is
@@ -134,3 +181,10 @@ UNLOCK_BANNER_DURATION = 2.5  # cosmetic only -- doesn't extend any movement loc
 
 HEART_ICON_MARGIN = 16
 HEART_ICON_SPACING = 32  # icon is 7px * scale=4 = 28px wide; must exceed that or icons overlap
+
+# --- Profiler overlay (F3) -------------------------------------------------------
+# How many recent frames its graph shows and its percentiles cover (~4s).
+
+PROFILER_HISTORY_FRAMES = 240
+# The readout's numbers are redrawn this often, so they can be read.
+PROFILER_TEXT_INTERVAL = 0.5
@@ -8,12 +8,30 @@ frames later means editing the JSON's "frames" table, not this loader.
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 
 import pygame
 
 from settings import SPRITES_DIR
 
+# Reaction effects (flash tints, fades) are cached per (frame, effect,
+# alpha), with alpha snapped to this many evenly spaced levels -- a fade
+# drawn at 60+ fps would otherwise never hit the same alpha twice. A
+# left-facing frame from SpriteSheet.get() is simply a different key.
+EFFECT_ALPHA_LEVELS = 32
+# Least-recently-used entries are dropped past this many. A player-sized
+# frame is ~50 KB, so the cache tops out around a dozen MB.
+EFFECT_CACHE_SIZE = 256
+
+_effect_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+# Sheets held resident by preload_sprites(), by name, and how many
+# preloads each is still held for.
+_sprite_cache: dict[str, SpriteSheet] = {}
+_sprite_refs: dict[str, int] = {}
+
 
 @dataclass(frozen=True)
 class SpriteSheet:
@@ -23,17 +41,65 @@ class SpriteSheet:
     `pygame.Surface`. `anchor` is the (x, y) offset, in *scaled* pixels from
     the surface's top-left, of the point that should align with an entity's
     world position (typically bottom-center / feet).
+
+    `flipped_frames` holds the horizontally mirrored frames for entities
+    facing left, each built the first time it's asked for -- so sprites that
+    never turn around (cutscene props, the heart icon) never pay for them.
     """
 
     frames: dict[str, pygame.Surface]
     anchor: tuple[int, int]
     scale: int
+    flipped_frames: dict[str, pygame.Surface] = field(default_factory=dict, repr=False)
 
-    def get(self, frame_name: str = "idle") -> pygame.Surface:
-        return self.frames[frame_name]
+    def get(self, frame_name: str = "idle", facing: int = 1) -> pygame.Surface:
+        """The frame to draw for an entity facing right (1) or left (-1)."""
+        if facing != -1:
+            return self.frames[frame_name]
+        flipped = self.flipped_frames.get(frame_name)
+        if flipped is None:
+            flipped = pygame.transform.flip(self.frames[frame_name], True, False)
+            self.flipped_frames[frame_name] = flipped
+        return flipped
 
 
 def load_sprite(name: str) -> SpriteSheet:
+    """The SpriteSheet for `assets/sprites/{name}.png` + `{name}.json`.
+
+    A sprite held by preload_sprites() comes straight from memory, already
+    decoded and scaled; anything else is read from disk on every call and
+    not kept (fine for one-off cutscene art).
+    """
+    sheet = _sprite_cache.get(name)
+    if sheet is not None:
+        return sheet
+    return _decode_sprite(name)
+
+
+def preload_sprites(names: Iterable[str]) -> None:
+    """Decode each of `names` now, if it isn't resident already, and keep
+    it resident until a matching release_sprites() -- so every later
+    load_sprite() for it (each room change, each respawn) is a lookup.
+    Reference-counted: two preloads of a name need two releases."""
+    for name in names:
+        if name not in _sprite_cache:
+            _sprite_cache[name] = _decode_sprite(name)
+        _sprite_refs[name] = _sprite_refs.get(name, 0) + 1
+
+
+def release_sprites(names: Iterable[str]) -> None:
+    """Undo one preload_sprites() of each of `names`; a sprite nothing
+    holds any more is dropped from memory."""
+    for name in names:
+        refs = _sprite_refs[name] - 1
+        if refs:
+            _sprite_refs[name] = refs
+        else:
+            del _sprite_refs[name]
+            del _sprite_cache[name]
+
+
+def _decode_sprite(name: str) -> SpriteSheet:
     """Load `assets/sprites/{name}.png` + `{name}.json` into a SpriteSheet.
 
     Scaling uses `pygame.transform.scale` (a plain nearest-neighbor-style
@@ -62,3 +128,59 @@ def load_sprite(name: str) -> SpriteSheet:
         anchor=(anchor_x * scale, anchor_y * scale),
         scale=scale,
     )
+
+
+def _quantize_alpha(alpha: float) -> int:
+    step = 255 / (EFFECT_ALPHA_LEVELS - 1)
+    return round(round(min(max(alpha, 0.0), 255.0) / step) * step)
+
+
+def _cached_effect(key: tuple) -> pygame.Surface | None:
+    surface = _effect_cache.get(key)
+    if surface is not None:
+        _effect_cache.move_to_end(key)
+    return surface
+
+
+def _remember_effect(key: tuple, surface: pygame.Surface) -> pygame.Surface:
+    _effect_cache[key] = surface
+    if len(_effect_cache) > EFFECT_CACHE_SIZE:
+        _effect_cache.popitem(last=False)
+    return surface
+
+
+def tinted_frame(frame: pygame.Surface, color: tuple[int, int, int], alpha: float) -> pygame.Surface:
+    """`frame` with a flat `color` additively flashed over it at `alpha`
+    (0-255) -- the brief reaction beats (absorb flash, hit, stumble, a
+    beast's telegraph).
+
+    Cached: the returned surface is shared, so callers must not modify it.
+    """
+    alpha = _quantize_alpha(alpha)
+    key = ("tint", frame, color, alpha)
+    tinted = _cached_effect(key)
+    if tinted is not None:
+        return tinted
+
+    tinted = frame.copy()
+    flash = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
+    flash.fill((*color, alpha))
+    tinted.blit(flash, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+    return _remember_effect(key, tinted)
+
+
+def faded_frame(frame: pygame.Surface, alpha: float) -> pygame.Surface:
+    """`frame` drawn at `alpha` (0-255) overall opacity -- death/absorb
+    fades and the dodge ghost.
+
+    Cached like tinted_frame(): don't modify the returned surface.
+    """
+    alpha = _quantize_alpha(alpha)
+    key = ("fade", frame, alpha)
+    faded = _cached_effect(key)
+    if faded is not None:
+        return faded
+
+    faded = frame.copy()
+    faded.set_alpha(alpha)
+    return _remember_effect(key, faded)
@@ -0,0 +1,51 @@
+"""Shared fonts and a cache of rendered strings.
+
+Rasterising a string is one of the most expensive calls a frame makes,
+and nearly every string on screen -- menu labels, prompts, the banner,
+narration lines -- is the same from one frame to the next. Scenes get
+their fonts from get_font(), so every scene using a size shares one Font,
+and draw text through render_text(), which renders each (font, text,
+color, antialias) once and hands back the same surface after that.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+# Least-recently-used strings are dropped past this many. Every string
+# the game draws is a line or two of UI text -- a few KB each -- so this
+# holds all of them at once for well under a couple of MB.
+TEXT_CACHE_SIZE = 256
+
+_fonts: dict[int, pygame.font.Font] = {}
+_text_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """The game's (default) font at `size`, loaded once and shared."""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+
+def render_text(
+    font: pygame.font.Font, text: str, color: tuple[int, int, int], antialias: bool = True
+) -> pygame.Surface:
+    """`font.render(text, antialias, color)`, cached.
+
+    Don't modify the returned surface -- it's shared with every later call.
+    Fade text with sprite_utils.faded_frame() rather than set_alpha().
+    """
+    key = (font, text, color, antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        return surface
+
+    surface = _text_cache[key] = font.render(text, antialias, color)
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surface
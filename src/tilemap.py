@@ -0,0 +1,64 @@
+"""Tile-grid room geometry: parsing a room's "tilemap" rows into rects.
+
+A tilemap room (see data/rooms.py) draws its geometry as rows of text, one
+character per `tile_size` x `tile_size` tile -- "#" ground, "=" platform,
+"-" one-way (jump-through) platform, anything else empty. Colliding
+against one rect per tile would multiply the solids every actor checks
+each step, so tiles of the same kind are merged into as few rects as a
+simple greedy pass finds: runs along each row first, then each run grown
+downward while the rows below repeat it exactly. A solid block of ground
+becomes a single rect; a one-tile-thick platform stays one rect however
+long it is.
+
+Pure geometry, no drawing -- the merge runs once, when
+tools/compile_rooms.py stores the room (src/room_store.py), and Room
+(src/level.py) colors the merged rects and renders them through its
+static layer like any other room's solids.
+"""
+
+from __future__ import annotations
+
+import pygame
+
+GROUND_TILE = "#"
+PLATFORM_TILE = "="
+ONE_WAY_TILE = "-"
+
+
+def _runs(row: str, tile: str) -> list[tuple[int, int]]:
+    """(start, end) column spans of consecutive `tile` characters."""
+    runs = []
+    start = None
+    for column, char in enumerate(row + " "):
+        if char == tile and start is None:
+            start = column
+        elif char != tile and start is not None:
+            runs.append((start, column))
+            start = None
+    return runs
+
+
+def merge_tiles(rows: list[str], tile: str, tile_size: int) -> list[pygame.Rect]:
+    """Every `tile` in `rows`, merged into rects in world pixels."""
+    rects: list[pygame.Rect] = []
+    # Rects still growing downward, by the column span they cover.
+    open_rects: dict[tuple[int, int], pygame.Rect] = {}
+    for row_index, row in enumerate(rows):
+        still_open = {}
+        for run in _runs(row, tile):
+            rect = open_rects.get(run)
+            if rect is not None:
+                rect.height += tile_size
+            else:
+                start, end = run
+                x, y = start * tile_size, row_index * tile_size
+                rect = pygame.Rect(x, y, (end - start) * tile_size, tile_size)
+                rects.append(rect)
+            still_open[run] = rect
+        open_rects = still_open
+    return rects
+
+
+def tilemap_size(rows: list[str], tile_size: int) -> tuple[int, int]:
+    """(width, height) in world pixels -- the longest row sets the width."""
+    return max(len(row) for row in rows) * tile_size, len(rows) * tile_size
@@ -13,13 +13,14 @@ from __future__ import annotations
 import pygame
 
 import audio
+import room_store
 import save_system
 import settings
 from cutscene_world import CutsceneWorldScene
 from game_progress import GameProgress
 from gameplay_scene import GameplayScene
-from rooms import ROOM_REGISTRY
 from scene import Scene
+from text_render import get_font, render_text
 
 BACKGROUND_PATH = settings.PROJECT_ROOT / "assets" / "backgrounds" / "cutscene_world.png"
 
@@ -45,15 +46,19 @@ class TitleScene(Scene):
         self.background = pygame.image.load(str(BACKGROUND_PATH)).convert()
         self._has_save = save_system.load_game() is not None
 
-        self._title_font = pygame.font.Font(None, 52)
-        self._subtitle_font = pygame.font.Font(None, 26)
-        self._item_font = pygame.font.Font(None, 34)
-        self._body_font = pygame.font.Font(None, 24)
+        self._title_font = get_font(52)
+        self._subtitle_font = get_font(26)
+        self._item_font = get_font(34)
+        self._body_font = get_font(24)
 
         self.view = "main"  # "main" | "confirm_new_game"
         self.selected_index = 0
         self._new_game_requested = False
         self._continue_requested = False
+        # What the last draw() showed, and where the menu sat -- moving the
+        # selection only changes that block (see dirty_rects()).
+        self._drawn_state: tuple[str, int] | None = None
+        self._menu_rect: pygame.Rect | None = None
 
         audio.play_track("exploration")
 
@@ -101,7 +106,7 @@ class TitleScene(Scene):
         if self._continue_requested:
             saved = save_system.load_game()
             progress = GameProgress(**saved)
-            checkpoint_room = ROOM_REGISTRY[progress.checkpoint_room_key]
+            checkpoint_room = room_store.load_room(progress.checkpoint_room_key)
             return GameplayScene(checkpoint_room, progress)  # sets its own room music
 
         if self._new_game_requested:
@@ -112,18 +117,31 @@ class TitleScene(Scene):
 
         return None
 
+    def dirty_rects(self) -> list[pygame.Rect] | None:
+        state = (self.view, self.selected_index)
+        if state == self._drawn_state:
+            return []
+        if (
+            self._drawn_state is not None
+            and self._menu_rect is not None
+            and state[0] == self._drawn_state[0] == "main"
+        ):
+            return [self._menu_rect]
+        return None
+
     def draw(self, surface: pygame.Surface) -> None:
+        self._drawn_state = (self.view, self.selected_index)
         surface.blit(self.background, (0, 0))
 
         scrim = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
         scrim.fill(COLOR_SCRIM)
         surface.blit(scrim, (0, 0))
 
-        title_surface = self._title_font.render(TITLE_TEXT, True, COLOR_TITLE)
+        title_surface = render_text(self._title_font, TITLE_TEXT, COLOR_TITLE)
         title_rect = title_surface.get_rect(centerx=settings.WINDOW_WIDTH // 2, top=110)
         surface.blit(title_surface, title_rect)
 
-        subtitle_surface = self._subtitle_font.render(SUBTITLE_TEXT, True, COLOR_SUBTITLE)
+        subtitle_surface = render_text(self._subtitle_font, SUBTITLE_TEXT, COLOR_SUBTITLE)
         subtitle_rect = subtitle_surface.get_rect(
             centerx=settings.WINDOW_WIDTH // 2, top=title_rect.bottom + 12
         )
@@ -136,18 +154,23 @@ class TitleScene(Scene):
 
     def _draw_menu(self, surface: pygame.Surface, top: int) -> None:
         y = top
+        item_rects = []
         for index, item in enumerate(self._items):
             color = COLOR_MENU_SELECTED if index == self.selected_index else COLOR_MENU_TEXT
             label = f"> {item}" if index == self.selected_index else item
-            text = self._item_font.render(label, True, color)
+            text = render_text(self._item_font, label, color)
             rect = text.get_rect(centerx=settings.WINDOW_WIDTH // 2, top=y)
             surface.blit(text, rect)
+            item_rects.append(rect)
             y += text.get_height() + 18
+        # Full-width rows: a label's width changes with its "> " marker.
+        menu_rect = item_rects[0].unionall(item_rects)
+        self._menu_rect = pygame.Rect(0, menu_rect.top, settings.WINDOW_WIDTH, menu_rect.height)
 
     def _draw_lines(self, surface: pygame.Surface, lines: list[str], font: pygame.font.Font, top: int) -> None:
         y = top
         for line in lines:
-            text = font.render(line, True, COLOR_MENU_BODY_TEXT)
+            text = render_text(font, line, COLOR_MENU_BODY_TEXT)
             rect = text.get_rect(centerx=settings.WINDOW_WIDTH // 2, top=y)
             surface.blit(text, rect)
             y += text.get_height() + 10
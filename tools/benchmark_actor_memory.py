@@ -0,0 +1,81 @@
+"""Measures what __slots__ buys the hot-path actor classes: bytes per
+instance. That's the whole of it -- attribute reads and writes time the
+same either way on Python 3.11, whose instance dicts are already inlined,
+so there's no speed column to report.
+
+Each class is compared against a copy of itself with its slots stripped
+out -- same methods, same __init__, attributes back in a per-instance
+__dict__ -- so the numbers isolate the storage layout and nothing else.
+Nothing is written to disk. Run from the project root:
+
+    python tools/benchmark_actor_memory.py
+
+Enemy and CorruptedPlant are views onto a NumPy store row (see
+src/entity_store.py), so their few bytes are the view object alone; the
+actors' state lives in the store's arrays.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from attack_beast import AttackBeast  # noqa: E402
+from enemy import Enemy, EnemyStore  # noqa: E402
+from hazard import CorruptedPlant, PlantStore  # noqa: E402
+from physics import CollisionResult  # noqa: E402
+from player import Player  # noqa: E402
+
+INSTANCES = 2_000
+
+# No sprite is ever touched outside draw(), so none is loaded -- that
+# keeps this runnable without a display.
+_RNG = random.Random(1234)
+_ENEMIES = EnemyStore(None, [(100, 600)], [(0, 400)])
+_PLANTS = PlantStore(None, [(100, 600)])
+
+# (label, class, factory building one instance of the class passed in)
+CASES = (
+    ("Player", Player, lambda cls: cls(None, 100.0, 600.0)),
+    ("AttackBeast", AttackBeast, lambda cls: cls(None, 100.0, 600.0, _RNG)),
+    ("CollisionResult", CollisionResult, lambda cls: cls()),
+    ("Enemy (view)", Enemy, lambda cls: cls(_ENEMIES, 0)),
+    ("CorruptedPlant (view)", CorruptedPlant, lambda cls: cls(_PLANTS, 0)),
+)
+
+
+def without_slots(cls: type) -> type:
+    """`cls` rebuilt as an ordinary dict-backed class."""
+    slots = set(getattr(cls, "__slots__", ()))
+    namespace = {
+        name: value for name, value in vars(cls).items() if name not in slots and name != "__slots__"
+    }
+    return type(f"Dict{cls.__name__}", cls.__bases__, namespace)
+
+
+def bytes_per_instance(factory, cls: type) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(cls) for _ in range(INSTANCES)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Less the list holding them -- one pointer per instance.
+    return (after - before) / len(instances) - 8
+
+
+def main() -> None:
+    print(f"{'class':<22}  {'dict bytes':>10}  {'slot bytes':>10}  {'saved':>6}")
+    for label, cls, factory in CASES:
+        dict_bytes = bytes_per_instance(factory, without_slots(cls))
+        slot_bytes = bytes_per_instance(factory, cls)
+        saved = 1 - slot_bytes / dict_bytes
+        print(f"{label:<22}  {dict_bytes:>10.0f}  {slot_bytes:>10.0f}  {saved:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
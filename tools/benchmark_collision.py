@@ -0,0 +1,139 @@
+"""Times physics.move_and_collide -- given a plain solids list, and given
+the per-room SpatialHash index -- against the original list-only
+implementation (copied below as original_move_and_collide), on synthetic
+rooms of 10, 100 and 1000 solids.
+
+Not an asset generator like the rest of this folder -- nothing is written
+to disk. Run from the project root:
+
+    python tools/benchmark_collision.py
+
+Each synthetic room is a long strip of ground plus scattered 12px-thin
+platforms (the same shape as the real rooms in data/rooms.py), and the
+moving box is a player-sized 36x60 box running and falling across it, so
+the numbers reflect the per-frame call pattern Player/Enemy/AttackBeast
+actually produce rather than a best case.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import pygame  # noqa: E402
+
+from physics import CollisionResult, SpatialHash, move_and_collide  # noqa: E402
+
+ROOM_SIZES = (10, 100, 1000)
+CALLS_PER_ROOM = 20_000
+BOX_WIDTH, BOX_HEIGHT = 36, 60
+DT = 1 / 60
+
+
+def original_move_and_collide(
+    x: float, y: float, width: int, height: int, dx: float, dy: float, solids: list[pygame.Rect]
+) -> tuple[float, float, CollisionResult]:
+    """move_and_collide as it was before the index, the sweep, one-way
+    platforms and slopes -- the baseline everything else is measured
+    against."""
+    result = CollisionResult()
+
+    x += dx
+    rect = pygame.Rect(round(x), round(y), width, height)
+    for solid in solids:
+        if rect.colliderect(solid):
+            if dx > 0:
+                rect.right = solid.left
+                result.touched_right = True
+            elif dx < 0:
+                rect.left = solid.right
+                result.touched_left = True
+            x = rect.x
+
+    y += dy
+    rect = pygame.Rect(round(x), round(y), width, height)
+    for solid in solids:
+        if rect.colliderect(solid):
+            if dy > 0:
+                rect.bottom = solid.top
+                result.touched_bottom = True
+            elif dy < 0:
+                rect.top = solid.bottom
+                result.touched_top = True
+            y = rect.y
+
+    return x, y, result
+
+
+def make_room(solid_count: int, rng: random.Random) -> list[pygame.Rect]:
+    # Rooms grow wider with their content rather than denser, the way a
+    # longer level would.
+    world_width = max(2000, solid_count * 60)
+    solids = [pygame.Rect(0, 660, world_width, 60)]
+    for _ in range(solid_count - 1):
+        x = rng.randrange(0, world_width - 150)
+        y = rng.randrange(120, 620)
+        solids.append(pygame.Rect(x, y, rng.randrange(60, 220), 12))
+    return solids
+
+
+def make_moves(solids: list[pygame.Rect], rng: random.Random) -> list[tuple[float, float, float, float]]:
+    world_width = solids[0].width
+    index = SpatialHash(solids)
+    moves = []
+    while len(moves) < CALLS_PER_ROOM:
+        x = rng.uniform(0, world_width - BOX_WIDTH)
+        y = rng.uniform(60, 600)
+        # Actors never start a frame embedded in a solid (the previous
+        # frame's resolution pushed them out), so neither do these.
+        box = pygame.Rect(round(x), round(y), BOX_WIDTH, BOX_HEIGHT)
+        if box.collidelist(index.query(box)) != -1:
+            continue
+        vx = rng.uniform(-260, 260)
+        vy = rng.uniform(-640, 1000)
+        moves.append((x, y, vx * DT, vy * DT))
+    return moves
+
+
+def time_calls(move, solids, moves) -> float:
+    """Microseconds per call, best of a few runs."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for x, y, dx, dy in moves:
+            move(x, y, BOX_WIDTH, BOX_HEIGHT, dx, dy, solids)
+        best = min(best, time.perf_counter() - start)
+    return best / len(moves) * 1e6
+
+
+def main() -> None:
+    rng = random.Random(1234)
+    print(f"{'solids':>7}  {'original us':>12}  {'list us':>8}  {'index us':>9}  {'list':>6}  {'index':>6}")
+    for solid_count in ROOM_SIZES:
+        solids = make_room(solid_count, rng)
+        moves = make_moves(solids, rng)
+        index = SpatialHash(solids)
+
+        # Every path must agree exactly -- these steps are all shorter than
+        # the box, so there's nothing for the sweep to change either.
+        for x, y, dx, dy in moves:
+            expected = original_move_and_collide(x, y, BOX_WIDTH, BOX_HEIGHT, dx, dy, solids)
+            assert move_and_collide(x, y, BOX_WIDTH, BOX_HEIGHT, dx, dy, solids) == expected, (x, y, dx, dy)
+            assert move_and_collide(x, y, BOX_WIDTH, BOX_HEIGHT, dx, dy, index) == expected, (x, y, dx, dy)
+
+        original_us = time_calls(original_move_and_collide, solids, moves)
+        list_us = time_calls(move_and_collide, solids, moves)
+        index_us = time_calls(move_and_collide, index, moves)
+        print(
+            f"{solid_count:>7}  {original_us:>12.2f}  {list_us:>8.2f}  {index_us:>9.2f}"
+            f"  {original_us / list_us:>5.2f}x  {original_us / index_us:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compiles every room in data/rooms.py into assets/rooms/{KEY}.room, the
+binary format the game actually loads (see src/room_store.py for the
+format itself).
+
+Re-run after editing data/rooms.py, same as the asset generators after
+editing a generator -- the game reads only the compiled files:
+
+    python tools/compile_rooms.py
+
+Each file is decoded again after writing and checked against its source
+room, and .room files for rooms that no longer exist are removed. A room
+reaching past room_store.MAX_COORDINATE on either axis is an error rather
+than a file with wrapped coordinates.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(PROJECT_ROOT / "data"))
+
+from room_store import MAX_COORDINATE, ROOMS_DIR, decode_room, encode_room, room_path  # noqa: E402
+from rooms import ROOM_REGISTRY  # noqa: E402
+
+
+def _expected(room_data: dict) -> dict:
+    """What decode_room() should give back for `room_data`, field by field
+    -- less a tilemap's rows, which come back as merged rects instead (its
+    one-way tiles joining any "one_way_platforms" it lists)."""
+    return {
+        name: [tuple(item) for item in value] if isinstance(value, list) else value
+        for name, value in room_data.items()
+        if name != "tilemap" and not (name == "one_way_platforms" and "tilemap" in room_data)
+    }
+
+
+def _extent(room: dict) -> int:
+    """The furthest coordinate `room` (as decoded) reaches on either axis:
+    its world size, or a rect/slope's far edge."""
+    furthest = [room["world_width"], room["world_height"]]
+    for name in ("platforms", "one_way_platforms", "slopes"):
+        for x, y, w, h, *_ in room.get(name, ()):
+            furthest += [x + w, y + h]
+    for name in ("exit_zone", "checkpoint_zone", "reveal_zone", "log_obstacle", "light_shaft", "warm_glow"):
+        if name in room:
+            x, y, w, h = room[name]
+            furthest += [x + w, y + h]
+    return max(furthest)
+
+
+if __name__ == "__main__":
+    ROOMS_DIR.mkdir(parents=True, exist_ok=True)
+    for key, room_data in ROOM_REGISTRY.items():
+        data = encode_room(room_data)
+        decoded = decode_room(data)
+        if _extent(decoded) > MAX_COORDINATE:
+            sys.exit(f"{key}: reaches {_extent(decoded)} px -- rooms must fit within {MAX_COORDINATE} px")
+        for name, value in _expected(room_data).items():
+            assert decoded[name] == value, (key, name, decoded[name], value)
+
+        out_path = room_path(key)
+        out_path.write_bytes(data)
+        print(f"wrote {out_path} ({len(data)} bytes)")
+
+    for stale in ROOMS_DIR.glob("*.room"):
+        if stale.stem not in ROOM_REGISTRY:
+            stale.unlink()
+            print(f"removed {stale} (no such room any more)")
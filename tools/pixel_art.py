@@ -2,7 +2,8 @@
 
 These tools run once, offline, to produce the tiny pixel-grid PNGs (and their
 JSON metadata) that the game loads at runtime. Nothing in here is imported by
-game code (`src/`) -- Pillow/numpy stay confined to asset generation.
+game code (`src/`) -- Pillow stays confined to asset generation (numpy is a
+runtime dependency too, for src/entity_store.py, but nothing here is).
 """
 
 from __future__ import annotations
@@ -0,0 +1,72 @@
+"""Replays recorded gameplay sessions headlessly, as fast as they'll run,
+and checks each one still ends exactly where it did when it was recorded.
+
+Record a session by playing with `python main.py --record run.replay`,
+then, from the project root:
+
+    python tools/replay_session.py run.replay
+    python tools/replay_session.py recordings/        # every *.replay in it
+
+Exits non-zero if any replay diverges from its recording -- a cheap
+regression check for physics/movement changes. (A recording only stays
+valid while the code it replays through behaves the same; a deliberate
+tuning change means re-recording, same as any golden file.)
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from replay import load_replay, matches_recording, play  # noqa: E402
+from simulate_headless import init_headless  # noqa: E402
+
+
+def replay_paths(targets: list[Path]) -> list[Path]:
+    paths: list[Path] = []
+    for target in targets:
+        paths.extend(sorted(target.glob("*.replay")) if target.is_dir() else [target])
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("targets", nargs="+", type=Path, help="replay files, or directories of them")
+    args = parser.parse_args()
+
+    init_headless()
+    failures = 0
+    total_game_time = 0.0
+    total_elapsed = 0.0
+    for path in replay_paths(args.targets):
+        replay = load_replay(path)
+        start = time.perf_counter()
+        scene, played = play(replay)
+        elapsed = time.perf_counter() - start
+        game_time = sum(dt for dt, _ in replay.steps())
+
+        matched = matches_recording(replay, scene)
+        if matched is None:
+            verdict = "no trailer (game didn't exit cleanly), not checked"
+        elif matched:
+            verdict = "ok"
+        else:
+            verdict = f"DIVERGED -- ended at ({scene.player.x:.2f}, {scene.player.y:.2f})"
+            failures += 1
+        print(f"{path}: {played} steps, {game_time:.1f}s of play in {elapsed:.2f}s -- {verdict}")
+        total_game_time += game_time
+        total_elapsed += elapsed
+
+    if total_elapsed > 0:
+        speedup = total_game_time / total_elapsed
+        print(f"total: {total_game_time:.1f}s of play in {total_elapsed:.2f}s ({speedup:.0f}x real time)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
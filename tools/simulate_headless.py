@@ -0,0 +1,187 @@
+"""Drives GameplayScene with no window, no audio device and no frame cap,
+feeding it a scripted PlayerInput sequence, and reports how many
+simulation steps per second it sustains plus where that time goes
+(player, enemies, beast, hazards, camera -- the zones GameplayScene marks with
+src/profiling.py -- and draw).
+
+Not an asset generator like most of this folder -- nothing is written to
+disk (checkpoint saves are redirected to a throwaway directory). Run from
+the project root:
+
+    python tools/simulate_headless.py CLEARING
+    python tools/simulate_headless.py --all --frames 20000 --script run_jump
+    python tools/simulate_headless.py FOREST_FLOOR --no-draw
+
+Each step uses the same fixed dt Game.run() does (1 / settings.
+SIMULATION_HZ), so the run is deterministic: the same room and script
+always end in the same place. If the player leaves the room (an exit, the
+reveal, a respawn), the room is rebuilt fresh and the script carries on,
+so the numbers always describe the room that was asked for.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(PROJECT_ROOT / "data"))
+
+# Must be set before pygame initializes its video/audio subsystems.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+import profiling  # noqa: E402
+import room_store  # noqa: E402
+import save_system  # noqa: E402
+import settings  # noqa: E402
+from game_progress import GameProgress  # noqa: E402
+from gameplay_scene import GAMEPLAY_SPRITES, GameplayScene  # noqa: E402
+from input import PlayerInput  # noqa: E402
+from sprite_utils import preload_sprites  # noqa: E402
+
+ZONES = ("player", "enemies", "beast", "hazards", "camera", "draw")
+
+InputScript = Callable[[int], PlayerInput]
+
+
+def _idle(frame: int) -> PlayerInput:
+    return PlayerInput()
+
+
+def _run_right(frame: int) -> PlayerInput:
+    return PlayerInput(move_right=True)
+
+
+def _run_jump(frame: int) -> PlayerInput:
+    # A full jump roughly every 0.4s -- keeps her airborne about half the
+    # time, so landing/ceiling collisions get exercised too.
+    phase = frame % 48
+    return PlayerInput(move_right=True, jump_pressed=phase == 0, jump_held=phase < 36)
+
+
+def _wander(frame: int) -> PlayerInput:
+    # Back and forth across the room, hopping, with the odd dodge and
+    # stumble -- every Player state gets some time.
+    heading_right = (frame // 600) % 2 == 0
+    phase = frame % 90
+    return PlayerInput(
+        move_left=not heading_right,
+        move_right=heading_right,
+        jump_pressed=phase == 0,
+        jump_held=phase < 40,
+        dodge_pressed=frame % 311 == 0,
+        attack_pressed=frame % 997 == 0,
+    )
+
+
+SCRIPTS: dict[str, InputScript] = {
+    "idle": _idle,
+    "run_right": _run_right,
+    "run_jump": _run_jump,
+    "wander": _wander,
+}
+
+
+def init_headless() -> pygame.Surface:
+    """Bring pygame up against the dummy drivers and return a surface the
+    size of Game's own game_surface to draw into. A display mode has to
+    exist even headless -- Room/load_sprite call convert()/convert_alpha()."""
+    pygame.init()
+    pygame.display.set_mode((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+    # Never touch the real save file -- CLEARING's checkpoint writes one.
+    save_system.SAVE_PATH = Path(tempfile.mkdtemp()) / "savegame.json"
+    # Same as Game does, so room restarts don't re-decode sprites.
+    preload_sprites(GAMEPLAY_SPRITES)
+    return pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
+
+
+def simulate(room_key: str, script: InputScript, frames: int, draw: bool, surface: pygame.Surface) -> dict:
+    room_data = room_store.load_room(room_key)
+    dt = 1 / settings.SIMULATION_HZ
+    frame = 0
+
+    def next_input() -> PlayerInput:
+        return script(frame)
+
+    def fresh_scene() -> GameplayScene:
+        scene = GameplayScene(room_data, GameProgress())
+        scene.input_source = next_input
+        return scene
+
+    scene = fresh_scene()
+    restarts = 0
+
+    profiling.reset()
+    profiling.enable()
+    start = time.perf_counter()
+    for frame in range(frames):
+        next_scene = scene.update(dt)
+        if next_scene is not None:
+            scene = fresh_scene()
+            restarts += 1
+        if draw:
+            with profiling.zone("draw"):
+                scene.draw(surface)
+    elapsed = time.perf_counter() - start
+    profiling.disable()
+
+    return {
+        "room": room_key,
+        "frames": frames,
+        "elapsed": elapsed,
+        "restarts": restarts,
+        "zones": profiling.totals(),
+        "final_position": (scene.player.x, scene.player.y),
+    }
+
+
+def print_report(report: dict) -> None:
+    frames = report["frames"]
+    elapsed = report["elapsed"]
+    game_seconds = frames / settings.SIMULATION_HZ
+    print(
+        f"{report['room']}: {frames} steps in {elapsed:.3f}s -- "
+        f"{frames / elapsed:,.0f} steps/s, {game_seconds / elapsed:,.1f}x real time"
+        f" ({report['restarts']} room restarts)"
+    )
+    zones = report["zones"]
+    accounted = 0.0
+    for name in ZONES:
+        if name not in zones:
+            continue
+        seconds = zones[name]
+        accounted += seconds
+        print(f"  {name:<9} {seconds / frames * 1e6:>9.1f} us/step  {seconds / elapsed:>6.1%}")
+    other = elapsed - accounted
+    print(f"  {'other':<9} {other / frames * 1e6:>9.1f} us/step  {other / elapsed:>6.1%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("room", nargs="?", choices=room_store.room_keys(), help="a compiled room's key")
+    parser.add_argument("--all", action="store_true", help="run every compiled room")
+    parser.add_argument("--frames", type=int, default=10_000, help="simulation steps per room")
+    parser.add_argument("--script", choices=sorted(SCRIPTS), default="wander")
+    parser.add_argument("--no-draw", action="store_true", help="time update() only")
+    args = parser.parse_args()
+    if not args.all and args.room is None:
+        parser.error("pass a room key or --all")
+
+    surface = init_headless()
+    room_keys = room_store.room_keys() if args.all else [args.room]
+    for room_key in room_keys:
+        report = simulate(room_key, SCRIPTS[args.script], args.frames, not args.no_draw, surface)
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()